@@ -1,5 +1,6 @@
 # mcp_server/main.py
 import os
+from contextlib import asynccontextmanager
 from typing import List
 from fastapi import FastAPI, File, UploadFile, BackgroundTasks, HTTPException
 from fastapi.staticfiles import StaticFiles
@@ -8,8 +9,24 @@ from fastapi.responses import JSONResponse
 
 from .compiler_service import create_compilation_job, get_job_status
 from policy_compiler_agents.visualize_graph import fetch_graph_data
+from neo4j_graph_engine.db import get_driver, close_driver
 
-app = FastAPI(title="Policy Compiler Agent")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: open the Neo4j driver once. Pipeline runs only close a driver
+    # they opened themselves, so every compilation job reuses this pool.
+    try:
+        get_driver()
+    except ValueError as e:
+        print(f"⚠️ Neo4j driver not created at startup: {e}")
+    
+    yield
+    
+    # Shutdown
+    await close_driver()
+
+app = FastAPI(title="Policy Compiler Agent", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -647,7 +647,7 @@ Extract all order and customer details from the text above."""
             print("="*50)
             
             try:
-                adjudicator = Adjudicator()
+                adjudicator = await Adjudicator.get_shared()
                 adjudication_result = await adjudicator.adjudicate(verified_record)
                 
                 # Save adjudication decision
@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 from processor import MCPProcessor
 from sse_starlette.sse import EventSourceResponse
 import os
-import json
+import orjson
 
 # Initialize Processor
 processor = MCPProcessor()
@@ -21,6 +21,13 @@ async def lifespan(app: FastAPI):
         # We might want to let it fail so Cloud Run restarts it
         # But let's allow startup so we can see logs
     
+    # Warm Neo4j so the first adjudication doesn't pay the cold-start cost
+    try:
+        await processor.warm_up_policy_graph()
+        print("✅ Policy graph warmed up")
+    except Exception as e:
+        print(f"⚠️ Policy graph warm-up failed: {e}")
+    
     yield
     
     # Shutdown
@@ -88,19 +95,19 @@ async def process_demo(request: Request):
                 async for event in processor.process_demo_scenario(scenario_data):
                     yield {
                         "event": "progress",
-                        "data": json.dumps(event)
+                        "data": orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
                     }
                 # Send completion event
                 yield {
                     "event": "complete",
-                    "data": json.dumps({"status": "complete"})
+                    "data": orjson.dumps({"status": "complete"}, option=orjson.OPT_NON_STR_KEYS).decode()
                 }
             except Exception as e:
                 import traceback
                 traceback.print_exc()
                 yield {
                     "event": "error",
-                    "data": json.dumps({"error": str(e)})
+                    "data": orjson.dumps({"error": str(e)}, option=orjson.OPT_NON_STR_KEYS).decode()
                 }
         
         return EventSourceResponse(event_generator())
@@ -82,6 +82,10 @@ class MCPProcessor:
             }
         }
     
+    async def warm_up_policy_graph(self):
+        """Create the shared adjudicator: loads categories and warms Neo4j caches."""
+        await Adjudicator.get_shared()
+    
     async def generate_with_retry(self, model, contents, config=None, max_retries=10):
         """
         Generate content with retry logic, rate limiting, and exponential backoff with jitter.
@@ -760,7 +764,7 @@ Extract all order and customer details from the text above."""
                 print("\n" + "="*50)
                 print("RUNNING ADJUDICATOR AGENT")
                 print("="*50)
-                adjudicator = Adjudicator()
+                adjudicator = await Adjudicator.get_shared()
                 adjudication_result = await adjudicator.adjudicate(verified_record)
                 
                 print(f"\nDECISION: {adjudication_result.get('decision', 'UNKNOWN')}")
@@ -993,7 +997,7 @@ Extract all order and customer details from the text above."""
                 print("RUNNING ADJUDICATOR AGENT (STREAMING)")
                 print("="*50)
                 
-                adjudicator = Adjudicator()
+                adjudicator = await Adjudicator.get_shared()
                 adjudication_result = None
                 
                 # Use streaming adjudicator to yield sub-step events
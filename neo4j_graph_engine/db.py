@@ -8,11 +8,17 @@ import asyncio
 import os
 from contextlib import asynccontextmanager
 from functools import wraps
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 
 from dotenv import load_dotenv
 from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
-from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+from neo4j.exceptions import (
+    ClientError,
+    DatabaseError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
 
 load_dotenv()
 
@@ -49,6 +55,11 @@ def get_driver() -> AsyncDriver:
     return _driver
 
 
+def is_driver_open() -> bool:
+    """Whether the driver singleton has been created (and not yet closed)."""
+    return _driver is not None
+
+
 async def reset_driver():
     """Reset the driver connection (used after connection failures)."""
     global _driver
@@ -162,14 +173,82 @@ async def execute_write(
     async with get_session() as session:
         result = await session.run(query, parameters or {})
         summary = await result.consume()
-        return {
-            "nodes_created": summary.counters.nodes_created,
-            "nodes_deleted": summary.counters.nodes_deleted,
-            "relationships_created": summary.counters.relationships_created,
-            "relationships_deleted": summary.counters.relationships_deleted,
-            "properties_set": summary.counters.properties_set,
-            "labels_added": summary.counters.labels_added,
-        }
+        return _write_counters(summary)
+
+
+async def execute_write_many(
+    queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+    stop_on_error: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Execute write queries in order over a single session.
+    
+    Each query runs in its own managed transaction (session.execute_write),
+    so the driver retries transient failures such as deadlocks in place.
+    A query the database rejects (syntax, constraint violations) is reported
+    as {"error": ...} rather than raised.
+    
+    Connection failures that outlast the driver's own retries resume from
+    the query that failed on a fresh session, with backoff; queries that
+    already committed are never replayed. Unlike with_retry, the shared
+    driver is not reset, since other callers may be using it concurrently.
+    
+    Args:
+        queries: (query, parameters) pairs
+        stop_on_error: Stop after the first rejected query
+        
+    Returns:
+        One write summary (or error) per executed query, in order
+    """
+    results = []
+    delay = INITIAL_RETRY_DELAY
+    attempt = 0
+    
+    while len(results) < len(queries):
+        try:
+            async with get_session() as session:
+                while len(results) < len(queries):
+                    query, parameters = queries[len(results)]
+                    try:
+                        summary = await session.execute_write(_run_and_consume, query, parameters or {})
+                    except (ClientError, DatabaseError) as e:
+                        results.append({"error": str(e)})
+                        if stop_on_error:
+                            return results
+                        continue
+                    results.append(_write_counters(summary))
+        except (ServiceUnavailable, SessionExpired, TransientError, OSError, ConnectionError) as e:
+            if len(results) == len(queries):
+                break  # Everything committed; only closing the session failed
+            if attempt >= MAX_RETRIES:
+                print(f"[NEO4J] All {MAX_RETRIES + 1} connection attempts failed.")
+                raise
+            attempt += 1
+            print(f"[NEO4J] Connection failed at query {len(results) + 1}/{len(queries)} "
+                  f"(attempt {attempt}/{MAX_RETRIES + 1}): {e}")
+            print(f"[NEO4J] Resuming in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
+    
+    return results
+
+
+async def _run_and_consume(tx, query: str, parameters: Dict[str, Any]):
+    """Transaction function: run one query and return its result summary."""
+    result = await tx.run(query, parameters)
+    return await result.consume()
+
+
+def _write_counters(summary) -> Dict[str, Any]:
+    """Extract the write counters from a result summary."""
+    return {
+        "nodes_created": summary.counters.nodes_created,
+        "nodes_deleted": summary.counters.nodes_deleted,
+        "relationships_created": summary.counters.relationships_created,
+        "relationships_deleted": summary.counters.relationships_deleted,
+        "properties_set": summary.counters.properties_set,
+        "labels_added": summary.counters.labels_added,
+    }
 
 
 @with_retry
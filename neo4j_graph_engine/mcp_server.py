@@ -585,20 +585,21 @@ async def sample_graph_data(limit: int = 5) -> Dict[str, Any]:
         for label_record in labels_result:
             label = label_record["label"]
             # Get sample nodes
+            # Labels can't be parameters; LIMIT can, so the plan is reused
             result = await execute_query(f"""
-                MATCH (n:{label})
+                MATCH (n:`{label}`)
                 RETURN properties(n) as props
-                LIMIT {limit}
-            """)
+                LIMIT $limit
+            """, {"limit": limit})
             samples[label] = [r["props"] for r in result]
         
         # Get sample relationships
-        rel_samples = await execute_query(f"""
+        rel_samples = await execute_query("""
             MATCH (a)-[r]->(b)
             RETURN labels(a) as from_labels, type(r) as rel_type, 
                    labels(b) as to_labels, properties(r) as props
-            LIMIT {limit * 3}
-        """)
+            LIMIT $limit
+        """, {"limit": limit * 3})
         samples["_relationships"] = [
             {
                 "from": r["from_labels"],
@@ -17,10 +17,21 @@ Gemini 3 Features Used:
 import sys
 import os
 import json
+import queue
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import time
+import random
 import asyncio
+import tempfile
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+from rapidfuzz import fuzz, process
 from google.genai import types
 from google.genai.types import ThinkingConfig, Schema
 
@@ -28,10 +39,79 @@ from google.genai.types import ThinkingConfig, Schema
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from neo4j_graph_engine.db import execute_query as query_graph
-from .tools import get_gemini_client
-from .graph_traversal import traverse_from_category, build_policy_profile, get_all_categories
+from .tools import get_gemini_client, parse_retry_after
+from .graph_traversal import (
+    traverse_from_category,
+    build_policy_profile,
+    get_all_categories,
+    warm_up_graph,
+)
 from .source_retrieval import get_source_text, format_source_texts_for_prompt
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    """
+    Route this module's log records through a QueueHandler so formatting and
+    stream I/O happen on a background listener thread, not the event loop.
+    """
+    if logger.handlers:
+        return
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("   [%(levelname)s] %(message)s"))
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(os.getenv("ADJUDICATOR_LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+
+
+_configure_logging()
+
+# Retry settings for Gemini calls (full-jitter exponential backoff)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+# Max in-flight Gemini calls per adjudicator instance. Services share one
+# instance (see AdjudicatorV2.get_shared), so this is effectively a
+# process-wide cap: sized so the processor's 5 concurrent emails can each have
+# a decision and a background explanation in flight, plus batch fan-out
+MAX_CONCURRENT_LLM_CALLS = int(os.getenv("ADJUDICATOR_MAX_CONCURRENT_LLM_CALLS", "12"))
+
+# Deterministic category matching: accept the top fuzzy match without an LLM
+# call only when it is both strong and clearly ahead of the runner-up
+CATEGORY_MATCH_MIN_SCORE = 0.85
+CATEGORY_MATCH_MIN_GAP = 0.10
+
+# The first (cheap) classification attempt only shows the LLM this many
+# fuzzy-ranked categories; the escalation attempt gets the full list
+CATEGORY_SHORTLIST_SIZE = 10
+CATEGORY_SHORTLIST_MIN_CONFIDENCE = 0.7
+DEFAULT_CATEGORY = "Most products"
+
+# How long a category's graph traversal is reused before re-querying Neo4j
+TRAVERSAL_CACHE_TTL = float(os.getenv("ADJUDICATOR_TRAVERSAL_CACHE_TTL", "300"))
+
+# Max remembered (item_name, order_category) -> category classifications
+CATEGORY_CACHE_SIZE = 4096
+
+# On-disk snapshot of the category list so short-lived workers skip the Neo4j
+# round-trip at startup; re-fetched once older than CATEGORY_SNAPSHOT_TTL
+CATEGORY_SNAPSHOT_PATH = os.getenv(
+    "ADJUDICATOR_CATEGORY_SNAPSHOT",
+    os.path.join(tempfile.gettempdir(), "adjudicator_categories.json")
+)
+CATEGORY_SNAPSHOT_TTL = float(os.getenv("ADJUDICATOR_CATEGORY_SNAPSHOT_TTL", "3600"))
+
+# How long a long-lived adjudicator keeps its in-memory category list before
+# re-querying Neo4j (picks up graphs recompiled by another process)
+CATEGORY_REFRESH_TTL = float(os.getenv("ADJUDICATOR_CATEGORY_REFRESH_TTL", "300"))
+
+RETRYABLE_ERROR_MARKERS = ("429", "500", "502", "503", "504", "UNAVAILABLE", "RESOURCE_EXHAUSTED", "OVERLOADED")
+
 
 # =============================================================================
 # CONDITION NORMALIZATION
@@ -56,6 +136,25 @@ CONDITION_TO_GRAPH = {
     "USED": None,
 }
 
+
+def _condition_key(condition: str) -> str:
+    """Canonical lookup key: trimmed, lowercase, underscores as spaces."""
+    return condition.strip().lower().replace("_", " ")
+
+
+# Single reverse index over both user enums and graph condition names, built
+# once so normalization is one hash lookup regardless of input spelling
+_CONDITION_INDEX = {
+    _condition_key(graph_condition): graph_condition
+    for graph_condition in CONDITION_TO_GRAPH.values()
+    if graph_condition
+}
+_CONDITION_INDEX.update(
+    (_condition_key(user_condition), graph_condition)
+    for user_condition, graph_condition in CONDITION_TO_GRAPH.items()
+)
+
+@lru_cache(maxsize=1024)
 def normalize_condition(user_condition: str) -> tuple:
     """
     Normalize user condition to graph condition name.
@@ -68,16 +167,92 @@ def normalize_condition(user_condition: str) -> tuple:
     if not user_condition:
         return (None, False)
     
-    # Try exact match first
-    upper = user_condition.upper().replace(" ", "_")
-    if upper in CONDITION_TO_GRAPH:
-        graph_condition = CONDITION_TO_GRAPH[upper]
-        return (graph_condition, True)
+    key = _condition_key(user_condition)
+    if key in _CONDITION_INDEX:
+        return (_CONDITION_INDEX[key], True)
     
     # No mapping found - return original
     return (user_condition, False)
 
 
+# =============================================================================
+# RETRY HELPERS
+# =============================================================================
+
+def _is_retryable_error(error: Exception) -> bool:
+    """Transient Gemini failures: rate limits, 5xx, timeouts, malformed JSON."""
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError, json.JSONDecodeError)):
+        return True
+    message = str(error).upper()
+    return any(marker in message for marker in RETRYABLE_ERROR_MARKERS)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2^attempt))."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+
+# =============================================================================
+# CONTEXT HELPERS
+# =============================================================================
+
+def _first_value(key: str, sources: tuple, default: Any = None) -> Any:
+    """Return the first truthy value for key across sources, in order."""
+    for source in sources:
+        value = source.get(key)
+        if value:
+            return value
+    return default
+
+
+# =============================================================================
+# CATEGORY SNAPSHOT
+# =============================================================================
+
+def _read_category_snapshot() -> Optional[List[str]]:
+    """Return the snapshotted category list, or None if missing, stale, or unreadable."""
+    try:
+        if time.time() - os.path.getmtime(CATEGORY_SNAPSHOT_PATH) >= CATEGORY_SNAPSHOT_TTL:
+            return None
+        with open(CATEGORY_SNAPSHOT_PATH, "rb") as f:
+            categories = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return categories if isinstance(categories, list) and categories else None
+
+
+def _write_category_snapshot(categories: List[str]) -> None:
+    """Atomically replace the snapshot so concurrent readers never see a partial file."""
+    tmp_path = f"{CATEGORY_SNAPSHOT_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(categories))
+        os.replace(tmp_path, CATEGORY_SNAPSHOT_PATH)
+    except OSError as e:
+        logger.warning("[CLASSIFY] Could not write category snapshot: %s", e)
+
+
+# =============================================================================
+# DATE PARSING
+# =============================================================================
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO-8601 date or datetime string.
+    
+    Results are cached by input string, so repeated adjudications of the
+    same order skip parsing entirely. On Python 3.11+ fromisoformat accepts
+    "Z" suffixes directly; the replace only runs on older interpreters.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        raise
+
+
 # =============================================================================
 # SCHEMA DEFINITIONS
 # =============================================================================
@@ -227,10 +402,110 @@ class AdjudicatorV2:
     - LLM for decision-making with deep reasoning
     """
     
-    def __init__(self, model: str = "gemini-3-pro-preview"):
+    # Process-wide instance for long-running services (see get_shared)
+    _shared_instance: Optional["AdjudicatorV2"] = None
+    _shared_lock = asyncio.Lock()
+    
+    def __init__(
+        self,
+        model: str = "gemini-3-pro-preview",
+        classify_thinking_level: str = "low",
+        decision_thinking_level: str = "high",
+        request_timeout: float = 60.0
+    ):
         self.model = os.getenv("ADJUDICATOR_MODEL", model)
+        self.classify_thinking_level = os.getenv("ADJUDICATOR_CLASSIFY_THINKING_LEVEL", classify_thinking_level)
+        self.decision_thinking_level = os.getenv("ADJUDICATOR_DECISION_THINKING_LEVEL", decision_thinking_level)
+        self.request_timeout = float(os.getenv("ADJUDICATOR_REQUEST_TIMEOUT", request_timeout))
         self.client = get_gemini_client()
         self.categories_cache = []
+        self._categories_json = "[]"  # Pre-serialized categories_cache for prompts
+        self._categories_set = frozenset()
+        self._categories_by_lower: Dict[str, str] = {}
+        self._category_choices: List[str] = []  # Lowercase names, same order as categories_cache
+        self._classification_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._classification_inflight: Dict[tuple, asyncio.Future] = {}
+        # Items the LLM could not place (bounded like _classification_cache)
+        self._known_bad_categories: "OrderedDict[tuple, None]" = OrderedDict()
+        self._categories_loaded_at = float("-inf")  # time.monotonic() of the last load
+        self._categories_lock = asyncio.Lock()
+        self._traversal_cache: Dict[str, tuple] = {}  # category -> (fetched_at, traversal)
+        self._traversal_locks: Dict[str, asyncio.Lock] = {}
+        self._llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    
+    @classmethod
+    async def get_shared(cls) -> "AdjudicatorV2":
+        """
+        Return the process-wide adjudicator, creating and initializing it on
+        first use. Reusing one instance keeps the category list, the
+        classification/traversal caches and the Gemini client warm across
+        requests instead of rebuilding them per adjudication.
+        """
+        if cls._shared_instance is None:
+            async with cls._shared_lock:
+                if cls._shared_instance is None:
+                    instance = cls()
+                    await instance.initialize()
+                    cls._shared_instance = instance
+        return cls._shared_instance
+    
+    async def initialize(self, refresh: bool = False) -> None:
+        """
+        Load the category list and warm Neo4j caches ahead of the first request.
+        Optional - classify_category() still loads categories lazily.
+        
+        Args:
+            refresh: Ignore the on-disk category snapshot and re-query Neo4j
+        """
+        # Independent round-trips: the warm-up touches every category itself
+        await asyncio.gather(
+            self._load_categories(refresh=refresh),
+            self._warm_up()
+        )
+    
+    async def _warm_up(self) -> None:
+        """Best-effort warm_up_graph(): a failure only costs the first request's latency."""
+        try:
+            await warm_up_graph()
+        except Exception as e:
+            logger.warning("[GRAPH] Warm-up failed, continuing without it: %s", e)
+    
+    async def _load_categories(self, refresh: bool = False) -> None:
+        """
+        Load ProductCategory names (snapshot or Neo4j) and pre-serialize them for prompts.
+        
+        A failed or empty refresh keeps the list already loaded, if any.
+        """
+        snapshot = None if refresh else _read_category_snapshot()
+        if snapshot:
+            categories = snapshot
+            logger.info("[CLASSIFY] Loaded categories from snapshot %s", CATEGORY_SNAPSHOT_PATH)
+        else:
+            try:
+                categories = await get_all_categories()
+            except Exception as e:
+                if not self.categories_cache:
+                    raise
+                logger.warning("[CLASSIFY] Category refresh failed, keeping current list: %s", e)
+                categories = []
+            if categories:
+                _write_category_snapshot(categories)
+            elif self.categories_cache:
+                self._categories_loaded_at = time.monotonic()
+                return
+        
+        self._categories_loaded_at = time.monotonic()
+        if categories == self.categories_cache:
+            return  # Unchanged: keep the classification cache
+        self.categories_cache = categories
+        self._categories_set = frozenset(self.categories_cache)
+        self._category_choices = [c.lower() for c in self.categories_cache]
+        self._categories_by_lower = dict(zip(self._category_choices, self.categories_cache))
+        # Compact JSON: indentation only adds prompt tokens
+        self._categories_json = orjson.dumps(self.categories_cache).decode()
+        self._classification_cache.clear()  # Stale against a new category list
+        self._known_bad_categories.clear()
+        logger.info("[CLASSIFY] Cached %s categories", len(self.categories_cache))
     
     # =========================================================================
     # LLM Helper
@@ -241,9 +516,15 @@ class AdjudicatorV2:
         system_instruction: str = None,
         response_schema: Schema = None,
         use_thinking: bool = False,
+        thinking_level: str = "high",
         max_retries: int = 3
     ) -> Any:
-        """Generate content with retry logic."""
+        """
+        Generate content with retry logic.
+        
+        thinking_level ("low", "medium", "high") only applies when
+        use_thinking is set; thought parts are never returned.
+        """
         
         config_kwargs = {}
         
@@ -255,72 +536,254 @@ class AdjudicatorV2:
             config_kwargs["response_mime_type"] = "application/json"
         
         if use_thinking:
-            config_kwargs["thinking_config"] = ThinkingConfig(thinking_level="high")
+            config_kwargs["thinking_config"] = ThinkingConfig(
+                thinking_level=thinking_level,
+                include_thoughts=False
+            )
         
         config = types.GenerateContentConfig(**config_kwargs) if config_kwargs else None
         
         for attempt in range(max_retries):
+            # Later attempts get more time in case the model is genuinely slow
+            timeout = self.request_timeout * (1.5 ** attempt)
             try:
-                response = await self.client.aio.models.generate_content(
-                    model=self.model,
-                    contents=prompt,
-                    config=config
-                )
+                async with self._llm_semaphore:
+                    response = await asyncio.wait_for(
+                        self.client.aio.models.generate_content(
+                            model=self.model,
+                            contents=prompt,
+                            config=config
+                        ),
+                        timeout=timeout
+                    )
                 
                 if response_schema:
-                    return json.loads(response.text)
+                    return orjson.loads(response.text)
                 return response.text.strip()
                 
-            except Exception as e:
-                print(f"   [WARN] Attempt {attempt + 1} failed: {e}")
+            except asyncio.TimeoutError:
+                logger.warning("Attempt %s timed out after %.0fs", attempt + 1, timeout)
                 if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(1)
+                await asyncio.sleep(_backoff_delay(attempt))
+            except Exception as e:
+                logger.warning("Attempt %s failed: %s", attempt + 1, e)
+                if attempt == max_retries - 1 or not _is_retryable_error(e):
+                    raise
+                retry_after = parse_retry_after(e)
+                if retry_after is not None:
+                    delay = min(retry_after, RETRY_MAX_DELAY)
+                else:
+                    delay = _backoff_delay(attempt)
+                await asyncio.sleep(delay)
     
     # =========================================================================
-    # STEP 1: Category Classification (Pure LLM)
+    # STEP 1: Category Classification (Deterministic match, then LLM)
     # =========================================================================
+    def _match_category_deterministic(self, order_category: str) -> Optional[str]:
+        """
+        Match the order's category to a graph category without the LLM.
+        
+        Returns the graph category on an exact (case-insensitive) match, or on
+        a fuzzy match that clears CATEGORY_MATCH_MIN_SCORE and leads the
+        runner-up by CATEGORY_MATCH_MIN_GAP. Returns None when ambiguous.
+        """
+        if not order_category:
+            return None
+        
+        target = order_category.strip().lower()
+        exact = self._categories_by_lower.get(target)
+        if exact:
+            return exact
+        
+        # Candidates below this can neither win nor block the winner via the
+        # gap rule, so rapidfuzz may drop them early
+        floor = CATEGORY_MATCH_MIN_SCORE - CATEGORY_MATCH_MIN_GAP
+        top = process.extract(
+            target, self._category_choices,
+            scorer=fuzz.ratio, limit=2, score_cutoff=floor * 100
+        )
+        if not top:
+            return None
+        best_score = top[0][1] / 100
+        best_category = self.categories_cache[top[0][2]]
+        runner_up = top[1][1] / 100 if len(top) > 1 else 0.0
+        
+        if best_score >= CATEGORY_MATCH_MIN_SCORE and best_score - runner_up >= CATEGORY_MATCH_MIN_GAP:
+            return best_category
+        return None
+    
+    def _shortlist_categories(self, item_name: str, order_category: str) -> List[str]:
+        """
+        Rank categories by fuzzy similarity to the item name / order category
+        and return the top CATEGORY_SHORTLIST_SIZE (plus the default category).
+        """
+        scores = [0.0] * len(self._category_choices)
+        for target in (order_category, item_name):
+            if not target:
+                continue
+            for _, score, index in process.extract(
+                target.strip().lower(), self._category_choices,
+                scorer=fuzz.ratio, limit=None
+            ):
+                if score > scores[index]:
+                    scores[index] = score
+        
+        ranked = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        shortlist = [self.categories_cache[i] for i in ranked[:CATEGORY_SHORTLIST_SIZE]]
+        if DEFAULT_CATEGORY in self._categories_set and DEFAULT_CATEGORY not in shortlist:
+            shortlist.append(DEFAULT_CATEGORY)
+        return shortlist
+    
+    def _remember_category(self, key: tuple, category: str) -> str:
+        """Store a classification in the bounded LRU cache and return it."""
+        self._classification_cache[key] = category
+        self._classification_cache.move_to_end(key)
+        if len(self._classification_cache) > CATEGORY_CACHE_SIZE:
+            self._classification_cache.popitem(last=False)
+        return category
+    
+    def _remember_unclassifiable(self, key: tuple) -> None:
+        """Record an item the LLM could not place, evicting the oldest beyond CATEGORY_CACHE_SIZE."""
+        self._known_bad_categories[key] = None
+        self._known_bad_categories.move_to_end(key)
+        if len(self._known_bad_categories) > CATEGORY_CACHE_SIZE:
+            self._known_bad_categories.popitem(last=False)
+    
     async def classify_category(self, item: Dict[str, Any]) -> str:
         """
         Classify product into one of 76 ProductCategory values.
-        Uses pure LLM with all categories - no fuzzy matching.
+        Unambiguous category matches are resolved locally; everything else
+        goes to the LLM, first over a fuzzy shortlist and then, if needed,
+        over the full category list.
         """
-        # Fetch categories if not cached
-        if not self.categories_cache:
-            self.categories_cache = await get_all_categories()
-            print(f"   [CLASSIFY] Cached {len(self.categories_cache)} categories")
+        # Fetch categories if not cached, and re-fetch them once stale
+        if not self.categories_cache or time.monotonic() - self._categories_loaded_at >= CATEGORY_REFRESH_TTL:
+            async with self._categories_lock:
+                if not self.categories_cache:
+                    await self._load_categories()
+                elif time.monotonic() - self._categories_loaded_at >= CATEGORY_REFRESH_TTL:
+                    await self._load_categories(refresh=True)
         
         item_name = item.get("item_name", "Unknown")
         order_category = item.get("category", "Unknown")
         
-        prompt = CATEGORY_CLASSIFICATION_PROMPT.format(
-            categories=json.dumps(self.categories_cache, indent=2),
-            item_name=item_name,
-            order_category=order_category
-        )
-        
-        print(f"   [CLASSIFY] Classifying: {item_name} ({order_category})")
-        
+        cache_key = (item_name, order_category)
+        cached = self._classification_cache.get(cache_key)
+        if cached:
+            self._classification_cache.move_to_end(cache_key)
+            logger.debug("[CLASSIFY] Cache hit: '%s' -> '%s'", item_name, cached)
+            return cached
+        
+        # Coalesce concurrent misses for the same item onto one classification
+        inflight = self._classification_inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        task = asyncio.ensure_future(self._classify_uncached(item_name, order_category, cache_key))
+        self._classification_inflight[cache_key] = task
+        task.add_done_callback(lambda _: self._classification_inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _classify_uncached(self, item_name: str, order_category: str, cache_key: tuple) -> str:
+        """Deterministic match, then LLM classification; stores successes in the cache."""
+        matched = self._match_category_deterministic(order_category)
+        if matched:
+            logger.info("[CLASSIFY] Deterministic match: '%s' -> '%s'", order_category, matched)
+            return self._remember_category(cache_key, matched)
+        
+        # Both LLM attempts already came back empty for this item against the
+        # same category list; asking again is a dead-end round-trip
+        if cache_key in self._known_bad_categories:
+            logger.info("[CLASSIFY] Known unclassifiable: %s (%s), defaulting", item_name, order_category)
+            return DEFAULT_CATEGORY
+        
+        logger.info("[CLASSIFY] Classifying: %s (%s)", item_name, order_category)
+        
+        # Attempt 1: cheap thinking level over a fuzzy shortlist.
+        # Attempt 2 (escalation): "high" thinking over the full category list,
+        # used when attempt 1 is invalid, low-confidence, or fell back to default.
+        shortlist = self._shortlist_categories(item_name, order_category)
+        attempts = [
+            (self.classify_thinking_level, orjson.dumps(shortlist).decode(), True),
+            ("high", self._categories_json, False),
+        ]
+        
+        indecisive_match = None
         try:
-            result = await self.generate_with_retry(
-                prompt,
-                response_schema=CATEGORY_MATCH_SCHEMA
-            )
-            
-            matched = result.get("matched_category", "Most products")
-            confidence = result.get("confidence", 0.0)
+            for thinking_level, categories_json, is_shortlist in attempts:
+                prompt = CATEGORY_CLASSIFICATION_PROMPT.format(
+                    categories=categories_json,
+                    item_name=item_name,
+                    order_category=order_category
+                )
+                result = await self.generate_with_retry(
+                    prompt,
+                    response_schema=CATEGORY_MATCH_SCHEMA,
+                    use_thinking=True,
+                    thinking_level=thinking_level
+                )
+                
+                matched = result.get("matched_category", DEFAULT_CATEGORY)
+                confidence = result.get("confidence", 0.0)
+                
+                # Validate that result is in our category list
+                if matched not in self._categories_set:
+                    logger.info("[CLASSIFY] LLM returned unknown category at thinking '%s': %s", thinking_level, matched)
+                    continue
+                if is_shortlist and (matched == DEFAULT_CATEGORY or confidence < CATEGORY_SHORTLIST_MIN_CONFIDENCE):
+                    indecisive_match = matched
+                    logger.info("[CLASSIFY] Shortlist result '%s' (confidence: %.2f) not decisive, escalating", matched, confidence)
+                    continue
+                
+                logger.info("[CLASSIFY] Result: '%s' (confidence: %.2f, thinking: %s)", matched, confidence, thinking_level)
+                return self._remember_category(cache_key, matched)
             
-            # Validate that result is in our category list
-            if matched in self.categories_cache:
-                print(f"   [CLASSIFY] Result: '{matched}' (confidence: {confidence:.2f})")
-                return matched
-            else:
-                print(f"   [CLASSIFY] LLM returned unknown category: {matched}, defaulting")
-                return "Most products"
+            if indecisive_match:
+                logger.info("[CLASSIFY] Escalation failed, keeping shortlist result '%s'", indecisive_match)
+                return indecisive_match
+            logger.info("[CLASSIFY] No valid category returned, defaulting")
+            self._remember_unclassifiable(cache_key)
+            return DEFAULT_CATEGORY
                 
         except Exception as e:
-            print(f"   [CLASSIFY] Error: {e}, defaulting to 'Most products'")
-            return "Most products"
+            logger.error("[CLASSIFY] Error: %s, defaulting to '%s'", e, DEFAULT_CATEGORY)
+            return DEFAULT_CATEGORY
+    
+    # =========================================================================
+    # STEP 1.5: Graph Traversal (TTL-cached per category)
+    # =========================================================================
+    async def get_traversal(self, category: str) -> Dict[str, Any]:
+        """
+        Return the graph traversal for a category, reusing a cached result for
+        TRAVERSAL_CACHE_TTL seconds. A per-category lock ensures concurrent
+        cold requests for the same category share one Neo4j query.
+        """
+        cached = self._traversal_cache.get(category)
+        if cached and time.monotonic() - cached[0] < TRAVERSAL_CACHE_TTL:
+            return cached[1]
+        
+        lock = self._traversal_locks.setdefault(category, asyncio.Lock())
+        async with lock:
+            cached = self._traversal_cache.get(category)
+            if cached and time.monotonic() - cached[0] < TRAVERSAL_CACHE_TTL:
+                return cached[1]
+            
+            traversal = await traverse_from_category(category)
+            self._traversal_cache[category] = (time.monotonic(), traversal)
+            return traversal
+    
+    def invalidate_rules(self) -> None:
+        """
+        Drop cached traversals and the category snapshot, and mark the category
+        list stale (call after the policy graph is rebuilt).
+        """
+        self._traversal_cache.clear()
+        self._categories_loaded_at = float("-inf")
+        try:
+            os.remove(CATEGORY_SNAPSHOT_PATH)
+        except OSError:
+            pass
     
     # =========================================================================
     # STEP 2: Build Context from Order
@@ -329,45 +792,20 @@ class AdjudicatorV2:
         """Build context from verified_order.json."""
         user_request = user_request or {}
         
-        # Handle nested structure
-        if "data" in verified_order:
-            data = verified_order["data"]
-            order_details = data.get("order_details", {})
-            items = data.get("items", [])
-            customer = data.get("customer", {})
-        else:
-            data = verified_order
-            order_details = verified_order.get("order_details", {})
-            items = verified_order.get("items") or verified_order.get("order_items", [])
-            customer = verified_order.get("customer", {})
-        
-        # Extract order_id
-        order_id = (
-            order_details.get("order_id") or 
-            verified_order.get("order_id") or 
-            data.get("order_id")
-        )
-        
-        # Extract delivered_at
-        delivered_at = (
-            order_details.get("delivered_at") or 
-            verified_order.get("delivered_at") or
-            data.get("delivered_at")
-        )
+        # Resolve the layout once: nested {"data": {...}} or flat
+        data = verified_order["data"] if "data" in verified_order else verified_order
+        order_details = data.get("order_details", {})
+        customer = data.get("customer", {})
+        items = data.get("items") or data.get("order_items", [])
         
-        # Extract membership_tier
-        membership_tier = (
-            verified_order.get("membership_tier") or
-            customer.get("membership_tier") or
-            "Standard"
-        )
+        # Sources for order-level fields, most specific first (skip the
+        # duplicate lookup when data is verified_order itself)
+        order_sources = (order_details, verified_order) if data is verified_order else (order_details, verified_order, data)
         
-        # Extract seller_type
-        seller_type = (
-            verified_order.get("seller_type") or
-            order_details.get("seller_type") or
-            "BestBuy"
-        )
+        order_id = _first_value("order_id", order_sources)
+        delivered_at = _first_value("delivered_at", order_sources)
+        membership_tier = _first_value("membership_tier", (verified_order, customer), "Standard")
+        seller_type = _first_value("seller_type", (verified_order, order_details), "BestBuy")
         
         # Calculate days_since_delivery
         mode = user_request.get("mode", "production")
@@ -377,13 +815,13 @@ class AdjudicatorV2:
         else:
             return_request_date = verified_order.get("return_request_date")
             
-            if delivered_at and return_request_date:
-                dt_delivered = self._parse_date(delivered_at)
-                dt_request = self._parse_date(return_request_date)
-                days_since = (dt_request.date() - dt_delivered.date()).days
-            elif delivered_at:
-                dt_delivered = self._parse_date(delivered_at)
-                days_since = (datetime.now().date() - dt_delivered.date()).days
+            if delivered_at:
+                delivered_date = self._parse_date(delivered_at).date()
+                if return_request_date:
+                    request_date = self._parse_date(return_request_date).date()
+                else:
+                    request_date = datetime.now().date()
+                days_since = (request_date - delivered_date).days
             else:
                 days_since = 9999
         
@@ -398,24 +836,15 @@ class AdjudicatorV2:
             "seller_type": seller_type,
             "delivered_at": delivered_at,
             "days_since_delivery": days_since,
-            "item_condition": (
-                verified_order.get("item_condition") or 
-                user_request.get("condition", "UNKNOWN")
-            ),
-            "return_reason": (
-                verified_order.get("return_reason_category") or
-                user_request.get("reason", "CHANGED_MIND")
-            ),
-            "region": verified_order.get("region") or customer.get("region") or "UNKNOWN"
+            "item_condition": verified_order.get("item_condition") or user_request.get("condition", "UNKNOWN"),
+            "return_reason": verified_order.get("return_reason_category") or user_request.get("reason", "CHANGED_MIND"),
+            "region": _first_value("region", (verified_order, customer), "UNKNOWN")
         }
     
     def _parse_date(self, date_val):
         """Parse date from string or datetime."""
         if isinstance(date_val, str):
-            if "T" in date_val:
-                return datetime.fromisoformat(date_val.replace("Z", "+00:00"))
-            else:
-                return datetime.strptime(date_val, "%Y-%m-%d")
+            return _parse_iso_datetime(date_val)
         return date_val
     
     # =========================================================================
@@ -500,21 +929,22 @@ class AdjudicatorV2:
             return_reason=context["return_reason"]
         )
         
-        print("   [DECISION] Calling LLM for policy decision...")
+        logger.info("[DECISION] Calling LLM for policy decision...")
         
         try:
             result = await self.generate_with_retry(
                 prompt,
                 system_instruction=DECISION_SYSTEM_PROMPT,
                 response_schema=DECISION_SCHEMA,
-                use_thinking=True
+                use_thinking=True,
+                thinking_level=self.decision_thinking_level
             )
             
-            print(f"   [DECISION] LLM decision: {result.get('decision', 'UNKNOWN')}")
+            logger.info("[DECISION] LLM decision: %s", result.get('decision', 'UNKNOWN'))
             return result
             
         except Exception as e:
-            print(f"   [DECISION] Error: {e}")
+            logger.error("[DECISION] Error: %s", e)
             return {
                 "decision": "MANUAL_REVIEW",
                 "reasoning": f"Decision failed: {str(e)}",
@@ -548,68 +978,69 @@ class AdjudicatorV2:
             explanation = await self.generate_with_retry(prompt)
             return explanation
         except Exception as e:
-            print(f"   [EXPLAIN] Error: {e}")
+            logger.error("[EXPLAIN] Error: %s", e)
             return decision_result.get("reasoning", "Please contact customer service for details.")
     
     # =========================================================================
     # MAIN ORCHESTRATOR
     # =========================================================================
-    async def adjudicate(self, verified_order: Dict[str, Any], user_request: Dict[str, Any] = None) -> Dict[str, Any]:
-        """
-        Main entry point - orchestrates the adjudication flow.
-        
-        1. Build context from order
-        2. Classify category (LLM)
-        3. Traverse graph for policy rules
-        4. Fetch source text from citations
-        5. Make decision (LLM)
-        6. Generate customer explanation
-        """
+    async def _decide(
+        self, verified_order: Dict[str, Any], user_request: Dict[str, Any] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Steps 1-5: returns (output without explanation, decision_result)."""
         user_request = user_request or {}
         
-        print("\n" + "="*60)
-        print("ADJUDICATOR AGENT v2.0 - Policy Decision Engine")
-        print("="*60)
+        logger.info("ADJUDICATOR AGENT v2.0 - Policy Decision Engine")
         
         # STEP 1: Build context
         context = self.build_context(verified_order, user_request)
-        print(f"   [CONTEXT] Order ID: {context['order_id']}")
-        print(f"   [CONTEXT] Days since delivery: {context['days_since_delivery']}")
-        print(f"   [CONTEXT] Membership: {context['membership_tier']}")
-        print(f"   [CONTEXT] Condition: {context['item_condition']}")
+        logger.info("[CONTEXT] Order ID: %s", context['order_id'])
+        logger.info("[CONTEXT] Days since delivery: %s", context['days_since_delivery'])
+        logger.info("[CONTEXT] Membership: %s", context['membership_tier'])
+        logger.info("[CONTEXT] Condition: %s", context['item_condition'])
         
         # STEP 1.5: Normalize condition for graph matching
         normalized_condition, is_match = normalize_condition(context["item_condition"])
         context["normalized_condition"] = normalized_condition
         context["condition_matched"] = is_match
         if is_match:
-            print(f"   [CONDITION] Normalized: '{context['item_condition']}' -> '{normalized_condition}'")
+            logger.info("[CONDITION] Normalized: '%s' -> '%s'", context['item_condition'], normalized_condition)
         else:
-            print(f"   [CONDITION] No mapping for: '{context['item_condition']}'")
+            logger.info("[CONDITION] No mapping for: '%s'", context['item_condition'])
         
-        # STEP 2: Classify category (Pure LLM)
+        # STEP 2: Classify category
         primary_item = context["items"][0] if context["items"] else {"item_name": "Unknown"}
         mapped_category = await self.classify_category(primary_item)
         context["mapped_category"] = mapped_category
         
         # STEP 3: Traverse graph for policy rules
-        print(f"   [GRAPH] Traversing from: {mapped_category}")
-        traversal_result = await traverse_from_category(mapped_category)
+        logger.info("[GRAPH] Traversing from: %s", mapped_category)
+        traversal_result = await self.get_traversal(mapped_category)
         policy_profile = build_policy_profile(traversal_result)
         
         # STEP 4: Fetch source text
-        print(f"   [SOURCE] Fetching {len(policy_profile['citations'])} citations...")
+        logger.info("[SOURCE] Fetching %s citations...", len(policy_profile['citations']))
         source_texts = get_source_text(policy_profile["citations"])
         
         # STEP 5: Make decision (LLM)
         decision_result = await self.make_llm_decision(policy_profile, source_texts, context)
         
-        # STEP 6: Generate customer explanation
-        print("   [EXPLAIN] Generating customer explanation...")
-        explanation = await self.generate_explanation(decision_result)
+        logger.info("FINAL DECISION: %s", decision_result["decision"])
+        logger.info("Reasoning: %s", decision_result.get("reasoning", "N/A"))
         
-        # Build final output
-        output = {
+        output = self._build_output(context, mapped_category, policy_profile, decision_result, None)
+        return output, decision_result
+    
+    def _build_output(
+        self,
+        context: Dict[str, Any],
+        mapped_category: str,
+        policy_profile: Dict[str, Any],
+        decision_result: Dict[str, Any],
+        explanation: Optional[str]
+    ) -> Dict[str, Any]:
+        """Assemble the adjudication result returned to callers."""
+        return {
             "order_id": context["order_id"],
             "decision": decision_result["decision"],
             "customer_explanation": explanation,
@@ -627,18 +1058,25 @@ class AdjudicatorV2:
             },
             "policy_profile": policy_profile  # Include for debugging
         }
+    
+    async def adjudicate(self, verified_order: Dict[str, Any], user_request: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Main entry point - orchestrates the adjudication flow.
         
-        # =========================================================================
-        # PRESENTATION OUTPUT
-        # =========================================================================
-        print("\n" + "="*60)
-        print(f"FINAL DECISION: {decision_result['decision']}")
-        print("="*60)
-        print(f"\nReasoning:\n{decision_result.get('reasoning', 'N/A')}\n")
+        1. Build context from order
+        2. Classify category (deterministic match or LLM)
+        3. Traverse graph for policy rules
+        4. Fetch source text from citations
+        5. Make decision (LLM)
+        6. Generate customer explanation
+        """
+        output, decision_result = await self._decide(verified_order, user_request)
         
+        # STEP 6: Generate customer explanation
+        logger.info("[EXPLAIN] Generating customer explanation...")
+        output["customer_explanation"] = await self.generate_explanation(decision_result)
         
-        print(f"\nCustomer Explanation:\n\"{explanation}\"")
-        print("="*60)
+        logger.info("Customer Explanation: \"%s\"", output["customer_explanation"])
         
         return output
     
@@ -655,9 +1093,7 @@ class AdjudicatorV2:
         """
         user_request = user_request or {}
         
-        print("\n" + "="*60)
-        print("ADJUDICATOR AGENT v2.0 - Policy Decision Engine (STREAMING)")
-        print("="*60)
+        logger.info("ADJUDICATOR AGENT v2.0 - Policy Decision Engine (STREAMING)")
         
         # =====================================================================
         # SUBSTEP 1: Build Context
@@ -671,8 +1107,8 @@ class AdjudicatorV2:
         context["normalized_condition"] = normalized_condition
         context["condition_matched"] = is_match
         
-        print(f"   [CONTEXT] Order ID: {context['order_id']}")
-        print(f"   [CONTEXT] Days: {context['days_since_delivery']}, Tier: {context['membership_tier']}")
+        logger.info("[CONTEXT] Order ID: %s", context['order_id'])
+        logger.info("[CONTEXT] Days: %s, Tier: %s", context['days_since_delivery'], context['membership_tier'])
         
         yield {
             "substep": "context", 
@@ -694,7 +1130,7 @@ class AdjudicatorV2:
         primary_item = context["items"][0] if context["items"] else {"item_name": "Unknown"}
         item_name = primary_item.get("item_name", "Unknown")
         
-        print(f"   [CLASSIFY] Classifying: {item_name}")
+        logger.info("[CLASSIFY] Classifying: %s", item_name)
         mapped_category = await self.classify_category(primary_item)
         context["mapped_category"] = mapped_category
         
@@ -710,8 +1146,8 @@ class AdjudicatorV2:
         # =====================================================================
         yield {"substep": "graph", "status": "active", "log": f"Traversing policy graph from '{mapped_category}'...", "data": None}
         
-        print(f"   [GRAPH] Traversing from: {mapped_category}")
-        traversal_result = await traverse_from_category(mapped_category)
+        logger.info("[GRAPH] Traversing from: %s", mapped_category)
+        traversal_result = await self.get_traversal(mapped_category)
         policy_profile = build_policy_profile(traversal_result)
         
         # Count hops for detailed display
@@ -733,7 +1169,7 @@ class AdjudicatorV2:
         num_citations = len(policy_profile.get("citations", []))
         yield {"substep": "sources", "status": "active", "log": f"Fetching {num_citations} policy citations...", "data": None}
         
-        print(f"   [SOURCE] Fetching {num_citations} citations...")
+        logger.info("[SOURCE] Fetching %s citations...", num_citations)
         source_texts = get_source_text(policy_profile["citations"])
         
         # Build citation details for log display
@@ -754,26 +1190,37 @@ class AdjudicatorV2:
         # =====================================================================
         yield {"substep": "decision", "status": "active", "log": "LLM analyzing policy rules...", "data": None}
         
-        print("   [DECISION] Calling LLM for policy decision...")
+        logger.info("[DECISION] Calling LLM for policy decision...")
         decision_result = await self.make_llm_decision(policy_profile, source_texts, context)
         decision = decision_result.get("decision", "UNKNOWN")
         
-        print(f"   [DECISION] Result: {decision}")
+        logger.info("[DECISION] Result: %s", decision)
         
-        yield {
-            "substep": "decision", 
-            "status": "complete", 
-            "log": f"{decision}", 
-            "data": {"decision": decision, "reasoning": decision_result.get("reasoning", "")}
-        }
-        
-        # =====================================================================
-        # SUBSTEP 6: Generate Explanation
-        # =====================================================================
-        yield {"substep": "explain", "status": "active", "log": "Generating customer explanation...", "data": None}
+        # Start the explanation now so it generates while the consumer
+        # handles the decision event
+        logger.info("[EXPLAIN] Generating customer explanation...")
+        explanation_task = asyncio.create_task(self.generate_explanation(decision_result))
         
-        print("   [EXPLAIN] Generating customer explanation...")
-        explanation = await self.generate_explanation(decision_result)
+        # If the consumer stops iterating (e.g. the SSE client disconnects)
+        # before the explanation is awaited, don't leave the Gemini call
+        # running and holding an _llm_semaphore slot
+        try:
+            yield {
+                "substep": "decision", 
+                "status": "complete", 
+                "log": f"{decision}", 
+                "data": {"decision": decision, "reasoning": decision_result.get("reasoning", "")}
+            }
+            
+            # =================================================================
+            # SUBSTEP 6: Generate Explanation
+            # =================================================================
+            yield {"substep": "explain", "status": "active", "log": "Generating customer explanation...", "data": None}
+            
+            explanation = await explanation_task
+        finally:
+            if not explanation_task.done():
+                explanation_task.cancel()
         
         yield {
             "substep": "explain", 
@@ -804,9 +1251,7 @@ class AdjudicatorV2:
             "policy_profile": policy_profile
         }
         
-        print("\n" + "="*60)
-        print(f"FINAL DECISION: {decision_result['decision']}")
-        print("="*60)
+        logger.info("FINAL DECISION: %s", decision_result["decision"])
         
         # Final yield with complete result
         yield {"substep": "FINAL", "status": "complete", "log": None, "data": output}
@@ -824,15 +1269,17 @@ if __name__ == "__main__":
     parser.add_argument("--test-mode", action="store_true", help="Use test mode")
     parser.add_argument("--days", type=int, default=10, help="Days since delivery")
     parser.add_argument("--condition", type=str, default="OPENED_LIKE_NEW", help="Item condition")
+    parser.add_argument("--refresh-schema", action="store_true", help="Ignore the cached category snapshot")
     
     args = parser.parse_args()
     
     async def main():
         agent = AdjudicatorV2()
+        await agent._load_categories(refresh=args.refresh_schema)
         
         if args.order_file and os.path.exists(args.order_file):
-            with open(args.order_file, 'r') as f:
-                verified_order = json.load(f)
+            with open(args.order_file, 'rb') as f:
+                verified_order = orjson.loads(f.read())
         else:
             verified_order = {
                 "order_id": "test-order-001",
@@ -849,7 +1296,7 @@ if __name__ == "__main__":
         }
         
         result = await agent.adjudicate(verified_order, user_request)
-        print("\n" + json.dumps(result, indent=2, default=str))
+        print("\n" + orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode())
     
     if sys.platform == 'win32':
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -12,20 +12,39 @@ It orchestrates the sequential execution of:
 Built using Google ADK patterns with shared session state.
 """
 
+import os
+import sys
 import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-from .ontology_agent import run_ontology_agent, design_ontology
-from .extraction_agent import run_extraction_agent, extract_policy_rules
-from .critic_agent import run_critic_agent, validate_artifacts
-from .builder_agent import run_builder_agent, build_graph
-from .tools import save_artifact, read_policy_markdown
+from .ontology_agent import run_ontology_agent, design_ontology, ONTOLOGY_SYSTEM_PROMPT
+from .extraction_agent import (
+    run_extraction_agent,
+    extract_policy_rules,
+    PAGE_EXTRACTION_PROMPT,
+    MULTI_PAGE_EXTRACTION_PROMPT,
+)
+from .critic_agent import run_critic_agent, validate_artifacts, get_extraction_feedback
+from .builder_agent import run_builder_agent, build_graph, create_schema_constraints
+from neo4j_graph_engine.db import close_driver, is_driver_open
+from .tools import (
+    save_artifact,
+    read_policy_markdown,
+    content_hash,
+    load_cached_stage,
+    save_cached_stage,
+)
 
 
 # Type for log callback
 LogCallback = Optional[callable]
 
+# Part of every stage cache key. Bump it when code that shapes a cached
+# stage's output changes (prompt building, GraphLinker, Cypher generation)
+# so earlier cached schemas and extractions are not reused
+STAGE_CACHE_VERSION = 1
+
 
 class PolicyCompilerPipeline:
     """
@@ -34,17 +53,83 @@ class PolicyCompilerPipeline:
     Implements Google ADK-style agent coordination with shared state.
     """
     
-    def __init__(self, max_revision_attempts: int = 2, log_callback: LogCallback = None):
+    def __init__(self, max_revision_attempts: int = 2, log_callback: LogCallback = None, use_cache: bool = True):
         """
         Initialize the pipeline.
         
         Args:
             max_revision_attempts: Maximum times to retry after critic rejection
             log_callback: Optional callback function for progress logging (receives message string)
+            use_cache: Reuse ontology/extraction results (and per-page extractions)
+                when their inputs are unchanged
         """
         self.max_revision_attempts = max_revision_attempts
+        self.use_cache = use_cache
         self.state: Dict[str, Any] = {}
-        self._log = log_callback or (lambda msg: print(msg))
+        self._log_sink = log_callback
+        self._log_queue: Optional[asyncio.Queue] = None
+    
+    # =========================================================================
+    # Logging - messages are queued during run() and written by one
+    # background task, so stages never block on console/callback I/O
+    # =========================================================================
+    def _log(self, msg: str) -> None:
+        """Queue a log message (written immediately outside of run())."""
+        if self._log_queue is not None:
+            self._log_queue.put_nowait(msg)
+        else:
+            self._write_logs([msg])
+    
+    def _write_logs(self, messages: List[str]) -> None:
+        """Deliver messages to the log callback, or to stdout in one write."""
+        if self._log_sink is None:
+            sys.stdout.write("\n".join(messages) + "\n")
+            return
+        for msg in messages:
+            self._log_sink(msg)
+    
+    async def _log_consumer(self) -> None:
+        """Drain the log queue in batches until the None sentinel arrives."""
+        while True:
+            batch = [await self._log_queue.get()]
+            while not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            
+            done = batch[-1] is None
+            messages = [msg for msg in batch if msg is not None]
+            if messages:
+                try:
+                    self._write_logs(messages)
+                except Exception as e:
+                    print(f"[PIPELINE] Log callback failed: {e}")
+            if done:
+                return
+    
+    async def _run_cached_stage(
+        self,
+        stage: str,
+        key: str,
+        artifact_name: str,
+        payload_key: str,
+        run_stage: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result of a stage for identical inputs, or run it.
+        
+        Only successful results are cached. On a hit the stage's artifact is
+        rewritten so anything reading it from disk sees this run's output.
+        """
+        if self.use_cache:
+            cached = load_cached_stage(stage, key)
+            if cached is not None:
+                self._log(f"[CACHE] {stage}: inputs unchanged, reusing cached result")
+                save_artifact(artifact_name, cached[payload_key])
+                return cached
+        
+        result = await run_stage()
+        if result.get("status") == "success":
+            save_cached_stage(stage, key, result)
+        return result
     
     async def run(self, clear_existing_graph: bool = True) -> Dict[str, Any]:
         """
@@ -56,6 +141,22 @@ class PolicyCompilerPipeline:
         Returns:
             Pipeline execution results
         """
+        self._log_queue = asyncio.Queue()
+        log_task = asyncio.create_task(self._log_consumer())
+        # One Neo4j driver serves every stage; only close it if this run opened it
+        owns_driver = not is_driver_open()
+        try:
+            return await self._run_stages(clear_existing_graph)
+        finally:
+            if owns_driver:
+                await close_driver()
+            # Flush everything logged so far before returning to the caller
+            self._log_queue.put_nowait(None)
+            await log_task
+            self._log_queue = None
+    
+    async def _run_stages(self, clear_existing_graph: bool) -> Dict[str, Any]:
+        """Run the four pipeline stages (see run())."""
         self._log("="*60)
         self._log("[PIPELINE] POLICY COMPILER PIPELINE - Starting")
         self._log("="*60)
@@ -66,10 +167,21 @@ class PolicyCompilerPipeline:
         }
         
         try:
+            # Stage cache keys: LLM stages are skipped when the policy text,
+            # upstream schema, model, system prompts and STAGE_CACHE_VERSION
+            # are all unchanged
+            policy_hash = content_hash(STAGE_CACHE_VERSION, read_policy_markdown())
+            
             # Stage 1: Ontology Design
             self._log("[STAGE 1/4] Ontology Design - Analyzing policy structure...")
             self._log("Using Gemini Thinking Mode for schema generation...")
-            ontology_result = await run_ontology_agent(log_callback=self._log)
+            ontology_result = await self._run_cached_stage(
+                "ontology",
+                content_hash(policy_hash, ONTOLOGY_SYSTEM_PROMPT, os.getenv("ONTOLOGY_MODEL", "")),
+                "proposed_schema",
+                "schema",
+                lambda: run_ontology_agent(log_callback=self._log)
+            )
             results["stages"]["ontology"] = ontology_result
             
             if ontology_result["status"] != "success":
@@ -81,10 +193,32 @@ class PolicyCompilerPipeline:
             self.state["schema"] = ontology_result["schema"]
             
             # Stage 2: Extraction
+            # Constraints depend only on the schema, so they are created in
+            # Neo4j while extraction runs instead of at the start of Stage 4
             self._log("[STAGE 2/4] Policy Extraction - Extracting entities & relationships...")
             self._log("Processing pages in parallel batches...")
-            extraction_result = await run_extraction_agent(schema=self.state["schema"], log_callback=self._log)
+            extraction_key = content_hash(
+                policy_hash,
+                self.state["schema"],
+                PAGE_EXTRACTION_PROMPT,
+                MULTI_PAGE_EXTRACTION_PROMPT,
+                os.getenv("EXTRACTION_MODEL", "")
+            )
+            extraction_result, constraints_result = await asyncio.gather(
+                self._run_cached_stage(
+                    "extraction",
+                    extraction_key,
+                    "extracted_cypher",
+                    "extraction",
+                    lambda: run_extraction_agent(
+                        schema=self.state["schema"], log_callback=self._log, use_cache=self.use_cache
+                    )
+                ),
+                create_schema_constraints(self.state["schema"])
+            )
             results["stages"]["extraction"] = extraction_result
+            results["stages"]["constraints"] = constraints_result
+            constraints_ready = all(c["status"] != "error" for c in constraints_result["constraints"])
             
             if extraction_result["status"] != "success":
                 return self._fail_pipeline(results, "Extraction failed")
@@ -110,19 +244,50 @@ class PolicyCompilerPipeline:
                     approved = True
                     self._log(f"[CRITIC] ✓ Approved on attempt {attempt + 1}")
                     break
+                elif critic_result.get("status") == "error":
+                    # The critic call itself failed - validate the same extraction again
+                    self._log("[CRITIC] Validation call failed, retrying validation...")
+                    continue
                 else:
                     if attempt < self.max_revision_attempts:
-                        self._log(f"[CRITIC] Revision needed, re-running extraction...")
-                        # Re-run extraction with critic feedback
+                        # Re-extraction can only fix extraction-level errors; without
+                        # any, another pass would just reproduce the same output
+                        validation = critic_result.get("validation", {})
+                        feedback = get_extraction_feedback(validation)
+                        if not feedback:
+                            self._log("[CRITIC] No actionable extraction issues, skipping re-extraction")
+                            break
+                        
+                        # Only re-extract the flagged pages when every issue maps to one
+                        only_chunks = validation.get("failed_chunk_ids") or None
+                        if only_chunks:
+                            self._log(f"[CRITIC] Revision needed, re-extracting {len(only_chunks)} page(s)...")
+                        else:
+                            self._log(f"[CRITIC] Revision needed, re-running extraction...")
+                        previous_hash = content_hash(self.state["extraction"].get("cypher_statements", []))
                         extraction_result = await run_extraction_agent(
                             schema=self.state["schema"],
-                            log_callback=self._log
+                            log_callback=self._log,
+                            critic_feedback=feedback,
+                            only_chunks=only_chunks,
+                            previous_extraction=self.state["extraction"],
+                            use_cache=self.use_cache
                         )
                         if extraction_result["status"] == "success":
                             self.state["extraction"] = extraction_result["extraction"]
+                            if content_hash(self.state["extraction"].get("cypher_statements", [])) == previous_hash:
+                                self._log("[CRITIC] Re-extraction produced identical statements, stopping revisions")
+                                break
             
             if not approved:
                 self._log("[CRITIC] ⚠ Proceeding despite validation issues (max attempts reached)")
+            elif attempt > 0:
+                # Cache the revision the critic approved, not the rejected first pass
+                save_cached_stage("extraction", extraction_key, {
+                    "status": "success",
+                    "extraction": self.state["extraction"],
+                    "summary": self.state["extraction"].get("extraction_summary", {}),
+                })
             
             self.state["validation"] = critic_result.get("validation", {})
             
@@ -132,6 +297,8 @@ class PolicyCompilerPipeline:
             builder_result = await run_builder_agent(
                 extraction=self.state["extraction"],
                 clear_existing=clear_existing_graph,
+                create_constraints=not constraints_ready,
+                close_connection=False,
                 log_callback=self._log
             )
             results["stages"]["builder"] = builder_result
@@ -172,27 +339,28 @@ class PolicyCompilerPipeline:
         return results
 
 
-async def run_pipeline(clear_existing: bool = True) -> Dict[str, Any]:
+async def run_pipeline(clear_existing: bool = True, use_cache: bool = True) -> Dict[str, Any]:
     """
     Convenience function to run the full pipeline.
     
     Args:
         clear_existing: Whether to clear existing graph
+        use_cache: Reuse cached ontology/extraction results for unchanged inputs
         
     Returns:
         Pipeline results
     """
-    pipeline = PolicyCompilerPipeline()
+    pipeline = PolicyCompilerPipeline(use_cache=use_cache)
     return await pipeline.run(clear_existing_graph=clear_existing)
 
 
 # CLI interface
 def main():
     import argparse
-    import os
     
     parser = argparse.ArgumentParser(description="Policy Compiler Pipeline")
     parser.add_argument("--run-pipeline", action="store_true", help="Run the full policy compilation pipeline")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every LLM stage even if inputs are unchanged")
     
     args = parser.parse_args()
     
@@ -203,7 +371,7 @@ def main():
 
     if args.run_pipeline:
         # Run async pipeline
-        asyncio.run(run_pipeline())
+        asyncio.run(run_pipeline(use_cache=not args.no_cache))
     else:
         parser.print_help()
 
@@ -6,11 +6,13 @@ This agent takes the validated Cypher statements and executes them
 in the Neo4j database to build the knowledge graph.
 """
 
+import re
 import json
+import time
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from .tools import load_artifact, save_artifact
+from .tools import load_artifact, save_artifact, open_event_log
 
 # Import Neo4j operations
 import sys
@@ -18,11 +20,15 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from neo4j_graph_engine.db import (
     execute_write,
+    execute_write_many,
     execute_query,
     test_connection,
     close_driver,
 )
 
+# Schema constraint strings like "UNIQUE(name)"
+UNIQUE_CONSTRAINT_PATTERN = re.compile(r'UNIQUE\((\w+)\)', re.IGNORECASE)
+
 
 async def create_schema_constraints(schema: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -31,8 +37,6 @@ async def create_schema_constraints(schema: Dict[str, Any] = None) -> Dict[str,
     Args:
         schema: The proposed schema from Ontology Agent
     """
-    from .tools import load_artifact
-    
     # Load schema if not provided
     if schema is None:
         try:
@@ -41,7 +45,7 @@ async def create_schema_constraints(schema: Dict[str, Any] = None) -> Dict[str,
             # Fallback to basic constraints
             schema = {"nodes": []}
     
-    constraints = []
+    constraints = {}  # name -> query
     
     # Generate constraints from schema nodes
     for node in schema.get("nodes", []):
@@ -53,142 +57,460 @@ async def create_schema_constraints(schema: Dict[str, Any] = None) -> Dict[str,
         for constraint in node.get("constraints", []):
             if "UNIQUE" in constraint.upper():
                 # Extract property name from constraint like "UNIQUE(name)"
-                import re
-                match = re.search(r'UNIQUE\((\w+)\)', constraint, re.IGNORECASE)
+                match = UNIQUE_CONSTRAINT_PATTERN.search(constraint)
                 if match:
                     prop = match.group(1)
-                    constraints.append(
-                        f"CREATE CONSTRAINT {label.lower()}_{prop} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
+                    name = f"{label.lower()}_{prop}"
+                    constraints[name] = (
+                        f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE"
                     )
         
         # Always create index on source_citation for traceability
-        constraints.append(
-            f"CREATE INDEX {label.lower()}_citation IF NOT EXISTS FOR (n:{label}) ON (n.source_citation)"
-        )
+        name = f"{label.lower()}_citation"
+        constraints[name] = f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.source_citation)"
     
-    # Execute constraints
+    # Skip what already exists. Uniqueness constraints are backed by an
+    # index of the same name, so one SHOW INDEXES covers both kinds.
     results = []
-    for constraint in constraints:
-        try:
-            await execute_write(constraint)
+    try:
+        rows = await execute_query("SHOW INDEXES YIELD name RETURN name")
+        existing = {row["name"] for row in rows}
+    except Exception:
+        existing = set()
+    for name in [name for name in constraints if name in existing]:
+        results.append({"query": constraints.pop(name)[:60], "status": "already_exists"})
+    
+    # Execute the missing ones over one session
+    pending = list(constraints.values())
+    try:
+        outcomes = await execute_write_many([(constraint, None) for constraint in pending]) if pending else []
+    except Exception as e:
+        outcomes = [{"error": str(e)}] * len(pending)
+    for constraint, outcome in zip(pending, outcomes):
+        error_msg = outcome.get("error")
+        if error_msg is None:
             results.append({"query": constraint[:60], "status": "success"})
-        except Exception as e:
-            error_msg = str(e)
-            if "already exists" in error_msg.lower() or "equivalent" in error_msg.lower():
-                results.append({"query": constraint[:60], "status": "already_exists"})
-            else:
-                results.append({"query": constraint[:60], "status": "error", "error": error_msg[:100]})
+        elif "already exists" in error_msg.lower() or "equivalent" in error_msg.lower():
+            results.append({"query": constraint[:60], "status": "already_exists"})
+        else:
+            results.append({"query": constraint[:60], "status": "error", "error": error_msg[:100]})
     
     return {"constraints": results}
 
 
+# Nodes deleted per inner transaction when clearing the graph
+CLEAR_BATCH_SIZE = 10000
+
+
 async def clear_existing_graph() -> Dict[str, Any]:
-    """Clear all existing nodes and relationships."""
+    """
+    Clear all existing nodes and relationships.
+    
+    Deletes in batches of CLEAR_BATCH_SIZE nodes so memory stays bounded on
+    large graphs. CALL { } IN TRANSACTIONS needs an auto-commit transaction,
+    which is what execute_write's session.run() provides.
+    """
     try:
-        # Delete relationships first
-        await execute_write("MATCH ()-[r]->() DELETE r")
-        # Then delete nodes
-        result = await execute_write("MATCH (n) DELETE n")
+        result = await execute_write(
+            f"MATCH (n) CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {CLEAR_BATCH_SIZE} ROWS"
+        )
         return {"status": "cleared", "summary": result}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
+# =============================================================================
+# STATEMENT BATCHING
+# =============================================================================
+# Max concurrent Neo4j writes while building (driver pool size is 10)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Min seconds between "Executed N/M" progress lines
+PROGRESS_INTERVAL = 1.0
+
+# Error details kept in the execution summary (lowest statement indexes)
+MAX_REPORTED_ERRORS = 10
+
+# Statement shapes emitted by extraction_agent.generate_cypher_payload. Each
+# statement is described by a parameter payload - supplied by the extraction
+# ("cypher_params") or recovered from the statement text - and regrouped into
+# parameterized UNWIND queries; anything else is executed verbatim.
+
+IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_]\w*')
+CYPHER_VALUE = r'"(?:[^"\\]|\\")*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|(?i:true|false)'
+NODE_PROPERTY_PATTERN = re.compile(rf'(\w+): ({CYPHER_VALUE})')
+NODE_MERGE_PATTERN = re.compile(
+    rf'MERGE \(n:([A-Za-z_]\w*) \{{(\w+: (?:{CYPHER_VALUE})(?:, \w+: (?:{CYPHER_VALUE}))*)\}}\)'
+)
+REL_MERGE_PATTERN = re.compile(
+    r'MATCH \(a:([A-Za-z_]\w*) \{name: "((?:[^"\\]|\\")*)"\}\), '
+    r'\(b:([A-Za-z_]\w*) \{name: "((?:[^"\\]|\\")*)"\}\) '
+    r'MERGE \(a\)-\[:([A-Za-z_]\w*)\]->\(b\)'
+)
+
+# String literals and backtick-quoted names in a verbatim statement; removed
+# before looking for '==' so a value like "a==b" doesn't count
+CYPHER_QUOTED_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|`[^`]*`')
+
+
+def _uses_double_equals(query: str) -> bool:
+    """Whether a statement uses '==' (not Cypher - equality is '=') outside quoted text."""
+    return "==" in query and "==" in CYPHER_QUOTED_PATTERN.sub("", query)
+
+
+def _parse_cypher_value(token: str) -> Any:
+    """Convert a literal matched by CYPHER_VALUE to its Python value."""
+    if token.startswith('"'):
+        return token[1:-1].replace('\\"', '"')
+    lowered = token.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if any(c in token for c in ".eE"):
+        return float(token)
+    return int(token)
+
+
+def parse_cypher_statement(stmt: str) -> Optional[Dict[str, Any]]:
+    """
+    Recover the parameter payload of a generated statement.
+    
+    Used for extractions saved without "cypher_params".
+    
+    Returns:
+        {"kind": "node", "label", "properties"} or {"kind": "relationship",
+        "from_label", "from_name", "type", "to_label", "to_name"}, or None
+        if the statement isn't one of the generated shapes
+    """
+    match = NODE_MERGE_PATTERN.fullmatch(stmt)
+    if match:
+        label, prop_string = match.groups()
+        pairs = NODE_PROPERTY_PATTERN.findall(prop_string)
+        props = {key: _parse_cypher_value(value) for key, value in pairs}
+        if len(props) != len(pairs):  # Duplicate keys: leave as-is
+            return None
+        return {"kind": "node", "label": label, "properties": props}
+    
+    match = REL_MERGE_PATTERN.fullmatch(stmt)
+    if match:
+        from_label, from_name, to_label, to_name, rel_type = match.groups()
+        return {
+            "kind": "relationship",
+            "from_label": from_label,
+            "from_name": from_name.replace('\\"', '"'),
+            "type": rel_type,
+            "to_label": to_label,
+            "to_name": to_name.replace('\\"', '"'),
+        }
+    
+    return None
+
+
+def _is_batchable(params: Dict[str, Any]) -> bool:
+    """Labels, types and keys are interpolated into the query, so they must be plain identifiers."""
+    if params.get("kind") == "node":
+        names = [params.get("label", ""), *params.get("properties", {})]
+    elif params.get("kind") == "relationship":
+        names = [params.get("from_label", ""), params.get("type", ""), params.get("to_label", "")]
+    else:
+        return False
+    return all(IDENTIFIER_PATTERN.fullmatch(name) for name in names)
+
+
+def plan_cypher_batches(
+    statements: List[str],
+    params: Optional[List[Optional[Dict[str, Any]]]] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Group generated MERGE statements into parameterized UNWIND queries.
+    
+    Node MERGEs with the same label and property keys, and relationship
+    MERGEs with the same endpoint labels and type, each become one query
+    with a row per original statement, so MERGE semantics are unchanged.
+    Exact duplicate statements (common when several rules reference the
+    same entity) are planned once, at their first index.
+    
+    Args:
+        statements: Cypher statements
+        params: Optional parameter payloads aligned with statements (see
+            parse_cypher_statement); parsed from the text when omitted
+    
+    Returns:
+        Phases to run in order - node groups, verbatim statements, then
+        relationship groups - so relationship endpoints always exist first.
+        Each unit is {"query", "rows", "indexes", "labels"}; rows is None for
+        a verbatim statement, and labels is None when the labels it touches
+        are unknown.
+    """
+    node_groups: Dict[tuple, Dict[str, Any]] = {}
+    rel_groups: Dict[tuple, Dict[str, Any]] = {}
+    verbatim = []
+    seen = set()
+    
+    for i, stmt in enumerate(statements):
+        stmt = stmt.strip()
+        if stmt in seen:
+            continue
+        seen.add(stmt)
+        
+        spec = params[i] if params is not None else parse_cypher_statement(stmt)
+        if not spec or not _is_batchable(spec):
+            verbatim.append({"query": stmt, "rows": None, "indexes": [i], "labels": None})
+            continue
+        
+        if spec["kind"] == "node":
+            label, props = spec["label"], spec["properties"]
+            key = (label, tuple(props))
+            group = node_groups.get(key)
+            if group is None:
+                prop_map = ", ".join(f"{k}: row.{k}" for k in props)
+                group = node_groups[key] = {
+                    "query": f"UNWIND $rows AS row MERGE (n:{label} {{{prop_map}}})",
+                    "rows": [],
+                    "indexes": [],
+                    "labels": {label},
+                }
+            group["rows"].append(props)
+        else:
+            from_label, rel_type, to_label = spec["from_label"], spec["type"], spec["to_label"]
+            key = (from_label, rel_type, to_label)
+            group = rel_groups.get(key)
+            if group is None:
+                group = rel_groups[key] = {
+                    "query": (
+                        f"UNWIND $rows AS row "
+                        f"MATCH (a:{from_label} {{name: row.from_name}}), (b:{to_label} {{name: row.to_name}}) "
+                        f"MERGE (a)-[:{rel_type}]->(b)"
+                    ),
+                    "rows": [],
+                    "indexes": [],
+                    "labels": {from_label, to_label},
+                }
+            group["rows"].append({"from_name": spec["from_name"], "to_name": spec["to_name"]})
+        group["indexes"].append(i)
+    
+    return [list(node_groups.values()), verbatim, list(rel_groups.values())]
+
+
+def _partition_lanes(units: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Split units into lanes that can run concurrently.
+    
+    Units sharing a label (directly or transitively) stay in one lane, in
+    order, so concurrent writes never contend for the same nodes' locks.
+    Units with unknown labels all share a single lane.
+    """
+    lanes: List[Dict[str, Any]] = []  # {"labels": set, "units": list}
+    for unit in units:
+        labels = unit["labels"]
+        if labels is None:
+            overlapping = [lane for lane in lanes if lane["labels"] is None]
+        else:
+            overlapping = [lane for lane in lanes if lane["labels"] is not None and lane["labels"] & labels]
+        
+        if not overlapping:
+            lanes.append({"labels": set(labels) if labels is not None else None, "units": [unit]})
+            continue
+        
+        # Merge every lane this unit links together into the first one
+        target = overlapping[0]
+        for lane in overlapping[1:]:
+            target["labels"] |= lane["labels"]
+            target["units"].extend(lane["units"])
+            lanes.remove(lane)
+        if labels is not None:
+            target["labels"] |= labels
+        target["units"].append(unit)
+    
+    return [lane["units"] for lane in lanes]
+
+
 async def execute_cypher_batch(
     statements: List[str],
-    batch_size: int = 10,
+    params: Optional[List[Optional[Dict[str, Any]]]] = None,
+    batch_size: int = 500,
     stop_on_error: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     log_callback: callable = None
 ) -> Dict[str, Any]:
     """
     Execute Cypher statements in batches.
     
+    Generated MERGE statements are regrouped into UNWIND queries (see
+    plan_cypher_batches) and sent batch_size rows per round-trip. Within
+    each phase, batches touching disjoint labels run concurrently, at most
+    max_concurrency at a time, each lane over a single session. If a batch
+    fails, its statements are re-run one by one so errors point at the
+    offending statement.
+    
     Args:
         statements: List of Cypher statements
+        params: Optional parameter payloads aligned with statements
         batch_size: Number of statements per batch
         stop_on_error: Whether to stop on first error
+        max_concurrency: Max in-flight Neo4j writes
         log_callback: Optional callback for progress logging
         
     Returns:
         Execution summary
     """
     log = log_callback or (lambda msg: print(msg))
-    results = []
-    total_nodes_created = 0
-    total_rels_created = 0
+    semaphore = asyncio.Semaphore(max_concurrency)
+    totals = {"nodes": 0, "rels": 0, "successful": 0, "failed": 0, "round_trips": 0, "done": 0}
+    last_report = time.monotonic()
     errors = []
     
-    for i, stmt in enumerate(statements):
-        try:
-            summary = await execute_write(stmt)
-            total_nodes_created += summary.get("nodes_created", 0)
-            total_rels_created += summary.get("relationships_created", 0)
-            results.append({
-                "index": i,
-                "status": "success",
-                "nodes": summary.get("nodes_created", 0),
-                "rels": summary.get("relationships_created", 0),
-            })
-        except Exception as e:
-            error_info = {
-                "index": i,
-                "status": "error",
-                "error": str(e)[:200],
-                "statement": stmt[:100],
-            }
-            errors.append(error_info)
-            results.append(error_info)
-            
-            if stop_on_error:
-                break
+    def should_stop() -> bool:
+        return stop_on_error and totals["failed"] > 0
+    
+    def record_error(index: int, error: str) -> None:
+        totals["failed"] += 1
+        errors.append({
+            "index": index,
+            "status": "error",
+            "error": error[:200],
+            "statement": statements[index][:100],
+        })
+        if len(errors) > MAX_REPORTED_ERRORS:
+            # Lanes finish out of order, so keep the lowest indexes seen so far
+            errors.sort(key=lambda e: e["index"])
+            del errors[MAX_REPORTED_ERRORS:]
+    
+    async def write_many(queries: List[tuple]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            results = await execute_write_many(queries, stop_on_error=stop_on_error)
+        totals["round_trips"] += len(results)
+        for result in results:
+            totals["nodes"] += result.get("nodes_created", 0)
+            totals["rels"] += result.get("relationships_created", 0)
+        return results
+    
+    def report_progress() -> None:
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            log(f"[BUILDER] Executed {totals['done']}/{planned} statements...")
+    
+    async def run_lane(units: List[Dict[str, Any]]) -> None:
+        # (query, parameters, statement indexes) per round-trip, all sent over one session
+        pending = []
+        for unit in units:
+            if unit["rows"] is None:
+                pending.append((unit["query"], None, unit["indexes"]))
+                continue
+            for start in range(0, len(unit["rows"]), batch_size):
+                pending.append((
+                    unit["query"],
+                    {"rows": unit["rows"][start:start + batch_size]},
+                    unit["indexes"][start:start + batch_size],
+                ))
         
-        # Progress logging
-        if (i + 1) % batch_size == 0:
-            log(f"[BUILDER] Executed {i + 1}/{len(statements)} statements...")
+        # Only loops when stop_on_error cut a call short at a failed batch
+        while pending and not should_stop():
+            try:
+                results = await write_many([(query, parameters) for query, parameters, _ in pending])
+            except Exception as e:
+                # Connection lost for good: nothing left in this lane can run
+                for _, _, indexes in pending:
+                    for index in indexes:
+                        record_error(index, str(e))
+                return
+            isolate = []
+            for (_, parameters, indexes), result in zip(pending, results):
+                if "error" not in result:
+                    totals["successful"] += len(indexes)
+                elif parameters is None:
+                    record_error(indexes[0], result["error"])
+                else:
+                    isolate.extend(indexes)
+            
+            if isolate:
+                # Re-run individually to isolate the failing statements
+                retried = await write_many([(statements[index], None) for index in isolate])
+                for index, result in zip(isolate, retried):
+                    if "error" in result:
+                        record_error(index, result["error"])
+                    else:
+                        totals["successful"] += 1
+            
+            totals["done"] += sum(len(indexes) for _, _, indexes in pending[:len(results)])
+            pending = pending[len(results):]
+            report_progress()
+    
+    phases = plan_cypher_batches(statements, params)
+    planned = sum(len(unit["indexes"]) for units in phases for unit in units)
+    duplicates = len(statements) - planned
+    if duplicates:
+        log(f"[BUILDER] Skipping {duplicates} duplicate statements")
+    log(f"[BUILDER] Batched {planned} statements into {sum(map(len, phases))} queries")
+    
+    # The critic flags '==' as a syntax error; fail such verbatim statements
+    # without a round-trip that is certain to fail (batched units carry
+    # their values as parameters, so they can't contain it)
+    verbatim_units = phases[1]
+    phases[1] = []
+    for unit in verbatim_units:
+        if _uses_double_equals(unit["query"]):
+            record_error(unit["indexes"][0], "Statement uses '==' instead of '=' (not sent)")
+            totals["done"] += 1
+        else:
+            phases[1].append(unit)
+    
+    for units in phases:
+        if should_stop():
+            break
+        await asyncio.gather(*(run_lane(lane) for lane in _partition_lanes(units)))
     
     return {
         "total_statements": len(statements),
-        "successful": len([r for r in results if r["status"] == "success"]),
-        "failed": len(errors),
-        "total_nodes_created": total_nodes_created,
-        "total_relationships_created": total_rels_created,
-        "errors": errors[:10],  # Limit error details
+        "successful": totals["successful"],
+        "failed": totals["failed"],
+        "duplicates_skipped": duplicates,
+        "round_trips": totals["round_trips"],
+        "total_nodes_created": totals["nodes"],
+        "total_relationships_created": totals["rels"],
+        "errors": sorted(errors, key=lambda e: e["index"]),
     }
 
 
+# All verification counts in one round-trip (plain Cypher subqueries, no APOC).
+# Nodes are scanned once, grouped by their label combination; per-label
+# counts are summed from those groups in verify_graph.
+VERIFY_GRAPH_QUERY = """
+CALL {
+    MATCH (n)
+    WITH labels(n) AS labels, count(*) AS count, count(n.source_citation) AS with_citation
+    RETURN sum(count) AS total_nodes,
+           sum(with_citation) AS with_citation,
+           collect({labels: labels, count: count}) AS label_sets
+}
+CALL {
+    MATCH ()-[r]->()
+    WITH type(r) AS type, count(*) AS count
+    ORDER BY count DESC
+    RETURN collect({type: type, count: count}) AS rel_counts
+}
+RETURN total_nodes, with_citation, label_sets, rel_counts
+"""
+
+
 async def verify_graph() -> Dict[str, Any]:
     """Verify the constructed graph."""
     try:
-        # Get node counts by label
-        label_counts = await execute_query("""
-            MATCH (n)
-            UNWIND labels(n) as label
-            RETURN label, count(*) as count
-            ORDER BY count DESC
-        """)
+        rows = await execute_query(VERIFY_GRAPH_QUERY)
+        row = rows[0] if rows else {}
         
-        # Get relationship counts
-        rel_counts = await execute_query("""
-            MATCH ()-[r]->()
-            RETURN type(r) as type, count(*) as count
-            ORDER BY count DESC
-        """)
-        
-        # Check for source citations
-        citation_check = await execute_query("""
-            MATCH (n)
-            WHERE n.source_citation IS NOT NULL
-            RETURN count(n) as with_citation
-        """)
-        
-        total_nodes = await execute_query("MATCH (n) RETURN count(n) as count")
+        label_counts: Dict[str, int] = {}
+        for label_set in row.get("label_sets", []):
+            for label in label_set["labels"]:
+                label_counts[label] = label_counts.get(label, 0) + label_set["count"]
         
         return {
             "status": "success",
-            "total_nodes": total_nodes[0]["count"] if total_nodes else 0,
-            "nodes_by_label": {r["label"]: r["count"] for r in label_counts},
-            "relationships_by_type": {r["type"]: r["count"] for r in rel_counts},
-            "nodes_with_citations": citation_check[0]["with_citation"] if citation_check else 0,
+            "total_nodes": row.get("total_nodes") or 0,
+            "nodes_by_label": dict(sorted(label_counts.items(), key=lambda item: item[1], reverse=True)),
+            "relationships_by_type": {r["type"]: r["count"] for r in row.get("rel_counts", [])},
+            "nodes_with_citations": row.get("with_citation") or 0,
         }
     except Exception as e:
         return {"status": "error", "error": str(e)}
@@ -198,6 +520,7 @@ async def build_graph(
     extraction: Dict[str, Any] = None,
     clear_existing: bool = True,
     create_constraints: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     log_callback: callable = None
 ) -> Dict[str, Any]:
     """
@@ -207,6 +530,7 @@ async def build_graph(
         extraction: Extraction artifact with cypher_statements
         clear_existing: Whether to clear existing graph first
         create_constraints: Whether to create indexes/constraints
+        max_concurrency: Max in-flight Neo4j writes while executing statements
         log_callback: Optional callback for progress logging
         
     Returns:
@@ -246,37 +570,51 @@ async def build_graph(
         "statements_to_execute": len(statements),
     }
     
-    # Clear existing graph if requested
-    if clear_existing:
-        log("[BUILDER] Clearing existing graph...")
-        clear_result = await clear_existing_graph()
-        build_log["clear_result"] = clear_result
-    
-    # Create constraints if requested
-    if create_constraints:
-        log("[BUILDER] Creating schema constraints...")
-        constraint_result = await create_schema_constraints()
-        build_log["constraints"] = constraint_result
-    
-    # Execute statements
-    log(f"[BUILDER] Executing {len(statements)} Cypher statements...")
-    execution_result = await execute_cypher_batch(statements, log_callback=log)
-    build_log["execution"] = execution_result
-    
-    log(f"[BUILDER] Executed: {execution_result.get('successful', 0)} success, {execution_result.get('failed', 0)} failed")
-    
-    # Verify the graph
-    log("[BUILDER] Verifying graph...")
-    verification = await verify_graph()
-    build_log["verification"] = verification
-    
-    # Determine overall status
-    if execution_result["failed"] == 0 and verification.get("total_nodes", 0) > 0:
-        build_log["status"] = "success"
-    elif execution_result["successful"] > 0 and verification.get("total_nodes", 0) > 0:
-        build_log["status"] = "partial_success"
-    else:
-        build_log["status"] = "failed"
+    # Each step is also appended to build_log.ndjson as it finishes
+    with open_event_log("build_log") as write_event:
+        def record(step: str, result: Any) -> None:
+            build_log[step] = result
+            write_event({"step": step, "result": result})
+        
+        write_event({"step": "start", "result": dict(build_log)})
+        
+        # Clear existing graph if requested
+        if clear_existing:
+            log("[BUILDER] Clearing existing graph...")
+            record("clear_result", await clear_existing_graph())
+        
+        # Create constraints if requested
+        if create_constraints:
+            log("[BUILDER] Creating schema constraints...")
+            record("constraints", await create_schema_constraints())
+        
+        # Execute statements
+        log(f"[BUILDER] Executing {len(statements)} Cypher statements...")
+        # Parameter payloads from the extraction; older artifacts without them
+        # (or with a mismatched length) fall back to parsing the statements
+        params = extraction.get("cypher_params")
+        if not params or len(params) != len(statements):
+            params = None
+        execution_result = await execute_cypher_batch(
+            statements, params=params, max_concurrency=max_concurrency, log_callback=log
+        )
+        record("execution", execution_result)
+        
+        log(f"[BUILDER] Executed: {execution_result.get('successful', 0)} success, {execution_result.get('failed', 0)} failed")
+        
+        # Verify the graph
+        log("[BUILDER] Verifying graph...")
+        verification = await verify_graph()
+        record("verification", verification)
+        
+        # Determine overall status
+        if execution_result["failed"] == 0 and verification.get("total_nodes", 0) > 0:
+            status = "success"
+        elif execution_result["successful"] > 0 and verification.get("total_nodes", 0) > 0:
+            status = "partial_success"
+        else:
+            status = "failed"
+        record("status", status)
     
     # Save build log
     artifact_path = save_artifact("build_log", build_log)
@@ -288,6 +626,8 @@ async def build_graph(
 async def run_builder_agent(
     extraction: Dict[str, Any] = None,
     clear_existing: bool = True,
+    create_constraints: bool = True,
+    close_connection: bool = True,
     log_callback: callable = None
 ) -> Dict[str, Any]:
     """
@@ -297,6 +637,9 @@ async def run_builder_agent(
     Args:
         extraction: The extraction from Extraction Agent
         clear_existing: Whether to clear existing graph
+        create_constraints: Whether to create indexes/constraints (skip if already done)
+        close_connection: Close the Neo4j driver when done (callers that manage
+            the driver themselves, like the pipeline, pass False)
         log_callback: Optional callback for progress logging
     """
     log = log_callback or (lambda msg: print(msg))
@@ -307,6 +650,7 @@ async def run_builder_agent(
         result = await build_graph(
             extraction=extraction,
             clear_existing=clear_existing,
+            create_constraints=create_constraints,
             log_callback=log,
         )
         
@@ -331,7 +675,8 @@ async def run_builder_agent(
         log(f"[BUILDER] Build failed: {e}")
         return {"status": "error", "error": str(e)}
     finally:
-        await close_driver()
+        if close_connection:
+            await close_driver()
 
 
 if __name__ == "__main__":
@@ -12,21 +12,60 @@ Gemini 3 Features Used:
 - system_instruction - Separated from user prompt
 """
 
-import json
 import os
 import re
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import orjson
 from google.genai import types
 from google.genai.types import ThinkingConfig, Schema
 
-from .tools import get_gemini_client, load_artifact, save_artifact
+from .tools import get_gemini_client, load_artifact, save_artifact, get_retry_delay
+from .builder_agent import parse_cypher_statement
 
 # Retry settings for transient API errors (503, 429)
 MAX_RETRIES = 3
 BASE_DELAY = 5.0
 
+# Node-creating statements (checked for source_citation in local validation)
+NODE_MERGE_PATTERN = re.compile(r'MERGE\s*\(', re.IGNORECASE)
+SOURCE_CITATION_PATTERN = re.compile(r'source_citation', re.IGNORECASE)
+
+
+def _extract_first_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in text, or None.
+    
+    Single pass tracking brace depth and string/escape state, for responses
+    that didn't parse as-is (e.g. wrapped in prose or code fences).
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
 
 # =============================================================================
 # GEMINI 3 SCHEMA ENFORCEMENT
@@ -178,19 +217,33 @@ async def validate_artifacts(
             "confidence_score": 0.3,
         }
     
+    # Optional fast path: skip the thinking-mode review for clean extractions
+    if os.getenv("CRITIC_FAST_PATH") == "1" and passes_local_checks(schema, extraction, local_issues):
+        validation = {
+            "validation_status": "approved",
+            "schema_issues": [],
+            "cypher_issues": [],
+            "coverage_issues": [],
+            "summary": "Local checks passed; LLM review skipped.",
+            "confidence_score": 0.75,
+            "failed_chunk_ids": [],
+        }
+        validation["_artifact_path"] = save_artifact("critic_report", validation)
+        return validation
+    
     # Use LLM for deeper validation
     client = get_gemini_client()
     
     prompt = f"""Validate this Neo4j schema and Cypher extraction for a retail return policy knowledge graph.
 
 SCHEMA:
-{json.dumps(schema, indent=2)}
+{orjson.dumps(schema).decode()}
 
 CYPHER STATEMENTS (first 50):
-{json.dumps(extraction.get("cypher_statements", [])[:50], indent=2)}
+{orjson.dumps(extraction.get("cypher_statements", [])[:50]).decode()}
 
 EXTRACTION SUMMARY:
-{json.dumps(extraction.get("extraction_summary", {}), indent=2)}
+{orjson.dumps(extraction.get("extraction_summary", {})).decode()}
 
 Perform comprehensive validation and provide your assessment."""
 
@@ -218,7 +271,7 @@ Perform comprehensive validation and provide your assessment."""
             error_str = str(e).lower()
             is_retryable = "503" in str(e) or "429" in str(e) or "overloaded" in error_str or "unavailable" in error_str
             if is_retryable and attempt < MAX_RETRIES - 1:
-                delay = BASE_DELAY * (2 ** attempt)
+                delay = get_retry_delay(e, attempt, BASE_DELAY)
                 print(f"[CRITIC] API error (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)[:80]}")
                 print(f"[CRITIC] Retrying in {delay:.1f}s...")
                 await asyncio.sleep(delay)
@@ -227,21 +280,21 @@ Perform comprehensive validation and provide your assessment."""
     else:
         raise last_error  # All retries failed
     
-    # Extract response text (handle thinking mode response structure)
+    # response_schema is set, so response.text already holds the structured
+    # JSON answer (thought parts are excluded) - no need to walk the parts
     response_text = response.text
-    if hasattr(response, 'candidates') and response.candidates:
-        for part in response.candidates[0].content.parts:
-            if hasattr(part, 'text') and not (hasattr(part, 'thought') and part.thought):
-                response_text = part.text
-                break
     
     try:
-        validation = json.loads(response_text)
-    except json.JSONDecodeError:
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            validation = json.loads(json_match.group())
-        else:
+        validation = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        validation = None
+        json_object = _extract_first_json_object(response_text)
+        if json_object:
+            try:
+                validation = orjson.loads(json_object)
+            except orjson.JSONDecodeError:
+                pass
+        if not isinstance(validation, dict):
             validation = {
                 "validation_status": "needs_revision",
                 "summary": "Could not parse validation response",
@@ -252,6 +305,8 @@ Perform comprehensive validation and provide your assessment."""
     if local_issues:
         validation["local_validation_issues"] = local_issues
     
+    validation["failed_chunk_ids"] = get_failed_chunk_ids(validation, extraction)
+    
     # Save artifact
     artifact_path = save_artifact("critic_report", validation)
     validation["_artifact_path"] = artifact_path
@@ -312,19 +367,122 @@ def perform_local_validation(
                 "statement_index": i,
             })
         
-        if "source_citation" not in stmt.lower() and "MERGE" in stmt.upper():
-            # Only check MERGE statements creating nodes
-            if re.match(r'MERGE\s*\(', stmt, re.IGNORECASE):
-                issues.append({
-                    "type": "cypher",
-                    "issue": f"Statement {i} might be missing source_citation",
-                    "severity": "warning",
-                    "statement_index": i,
-                })
+        # Only check MERGE statements creating nodes; the anchored match is
+        # cheap, so it runs before the case-insensitive scan of the whole string
+        if NODE_MERGE_PATTERN.match(stmt) and not SOURCE_CITATION_PATTERN.search(stmt):
+            issues.append({
+                "type": "cypher",
+                "issue": f"Statement {i} might be missing source_citation",
+                "severity": "warning",
+                "statement_index": i,
+            })
     
     return issues
 
 
+def passes_local_checks(
+    schema: Dict[str, Any],
+    extraction: Dict[str, Any],
+    local_issues: List[Dict[str, Any]]
+) -> bool:
+    """
+    Whether an extraction is clean enough to approve without the LLM review.
+    
+    Requires no local issues at all (so every node MERGE has a citation and
+    no relationship was orphaned), at least one statement, and only labels
+    the schema defines. Labels come from cypher_params, or are parsed from
+    the statements when it is missing; a statement whose labels can't be
+    determined fails the check so the LLM review runs.
+    """
+    statements = extraction.get("cypher_statements")
+    if local_issues or not statements:
+        return False
+    
+    params = extraction.get("cypher_params") or []
+    if len(params) != len(statements):
+        params = [None] * len(statements)
+    
+    schema_labels = {node.get("label") for node in schema.get("nodes", [])}
+    for stmt, spec in zip(statements, params):
+        spec = spec or parse_cypher_statement(stmt.strip())
+        if not spec:
+            return False
+        if spec.get("kind") == "node":
+            labels = [spec.get("label")]
+        else:
+            labels = [spec.get("from_label"), spec.get("to_label")]
+        if not schema_labels.issuperset(labels):
+            return False
+    return True
+
+
+def get_extraction_feedback(validation: Dict[str, Any]) -> str:
+    """
+    Summarize the critic issues a re-extraction can actually address.
+    
+    Schema issues need a new ontology and warnings don't block approval, so
+    only error-level Cypher/extraction issues and coverage gaps are kept.
+    
+    Returns:
+        Feedback text for the extraction prompt, or "" if nothing is actionable
+    """
+    lines = []
+    
+    issues = validation.get("cypher_issues", []) + [
+        issue for issue in validation.get("local_validation_issues", [])
+        if issue.get("type") in ("cypher", "extraction")
+    ]
+    for issue in issues:
+        if issue.get("severity") != "error":
+            continue
+        line = f"- {issue.get('issue', '')}"
+        if issue.get("fix"):
+            line += f" (fix: {issue['fix']})"
+        lines.append(line)
+    
+    for gap in validation.get("coverage_issues", []):
+        lines.append(f"- Missing: {gap.get('missing', '')} (fix: {gap.get('recommendation', '')})")
+    
+    return "\n".join(lines)
+
+
+def get_failed_chunk_ids(validation: Dict[str, Any], extraction: Dict[str, Any]) -> List[str]:
+    """
+    Map the blocking critic issues back to the pages they came from.
+    
+    Each error-level issue must point at a statement (statement_index) whose
+    cypher_params entry carries the chunk id of the page the entity or
+    relationship was extracted from; coverage gaps and issues about the
+    extraction as a whole can't be localized.
+    
+    Returns:
+        Chunk ids to re-extract, or [] if the whole document needs another pass
+    """
+    if validation.get("coverage_issues"):
+        return []
+    
+    issues = [
+        issue for issue in validation.get("cypher_issues", []) + [
+            issue for issue in validation.get("local_validation_issues", [])
+            if issue.get("type") in ("cypher", "extraction")
+        ]
+        if issue.get("severity") == "error"
+    ]
+    params = extraction.get("cypher_params") or []
+    
+    chunks = set()
+    for issue in issues:
+        index = issue.get("statement_index")
+        if not isinstance(index, int) or not 0 <= index < len(params) or not params[index]:
+            return []
+        chunk = params[index].get("chunk")
+        if not chunk:
+            return []
+        chunks.add(chunk)
+    
+    return sorted(chunks)
+
+
 async def run_critic_agent(
     schema: Dict[str, Any] = None,
     extraction: Dict[str, Any] = None,
@@ -376,4 +534,4 @@ async def run_critic_agent(
 if __name__ == "__main__":
     import asyncio
     result = asyncio.run(run_critic_agent())
-    print(json.dumps(result, indent=2, default=str))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode())
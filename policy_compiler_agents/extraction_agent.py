@@ -15,18 +15,22 @@ Gemini 3 Features Used:
 
 import os
 import asyncio
-import json
 import re
-from difflib import SequenceMatcher
-from typing import Any, Dict, List, Tuple, Optional
+from contextlib import nullcontext
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 
+import orjson
 from google.genai import types
+from rapidfuzz import fuzz, process
 
 from .tools import (
     get_gemini_client,
     read_policy_markdown,
     save_artifact,
     load_artifact,
+    content_hash,
+    load_cached_stage,
+    save_cached_stage,
     CitationManager,
     POLICY_DOCS_DIR,
 )
@@ -76,40 +80,79 @@ CRITICAL RULES:
 6. EXHAUSTIVE EXTRACTION: Extract ALL relationships implied by the text."""
 
 
+# Max pages extracted concurrently (Gemini calls in flight)
+EXTRACT_CONCURRENCY = int(os.getenv("EXTRACT_CONCURRENCY", "4"))
+
+# Pages packed into one Gemini call (batch prompting); 1 keeps one call per page
+PAGES_PER_CALL = max(1, int(os.getenv("EXTRACT_PAGES_PER_CALL", "1")))
+
+# <!-- PAGE:<filename>:<page_num>:<start_line>:<end_line> --> marker lines from
+# ingestion (anything after the marker on its line is dropped); a marker
+# never spans lines
+PAGE_MARKER_PATTERN = re.compile(
+    r'^<!--[^\S\n]*PAGE:([^:\n]+):(\d+):(\d+):(\d+)[^\S\n]*-->[^\n]*(?:\n|$)', re.MULTILINE
+)
+
+
+def iter_page_markers(markdown: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the pages of markdown content, split by page markers.
+    
+    Page content is sliced straight from the markdown between consecutive
+    marker lines, without splitting the document into lines first.
+    """
+    matches = PAGE_MARKER_PATTERN.finditer(markdown)
+    match = next(matches, None)
+    while match is not None:
+        next_match = next(matches, None)
+        if next_match is None:
+            content = markdown[match.end():]
+        else:
+            content = markdown[match.end():next_match.start()]
+            if content.endswith("\n"):
+                content = content[:-1]  # Newline that ends the last line before the next marker
+        
+        yield {
+            "filename": match.group(1),
+            "page_num": int(match.group(2)),
+            "start_line": int(match.group(3)),
+            "end_line": int(match.group(4)),
+            "content": content,
+        }
+        match = next_match
+
+
 def split_by_page_markers(markdown: str) -> List[Dict[str, Any]]:
     """Split markdown content by page markers."""
-    pages = []
-    current_page = None
-    current_lines = []
-    
-    page_pattern = re.compile(r'<!--\s*PAGE:([^:]+):(\d+):(\d+):(\d+)\s*-->')
-    
-    for line in markdown.split("\n"):
-        match = page_pattern.match(line)
-        if match:
-            if current_page is not None:
-                current_page["content"] = "\n".join(current_lines)
-                pages.append(current_page)
-            
-            current_page = {
-                "filename": match.group(1),
-                "page_num": int(match.group(2)),
-                "start_line": int(match.group(3)),
-                "end_line": int(match.group(4)),
-            }
-            current_lines = []
-        else:
-            current_lines.append(line)
-    
-    if current_page is not None:
-        current_page["content"] = "\n".join(current_lines)
-        pages.append(current_page)
-    
-    return pages
+    return list(iter_page_markers(markdown))
+
+
+def page_chunk_id(page: Dict[str, Any]) -> str:
+    """Stable id of a page, used to re-extract only the pages the critic flagged."""
+    return f"{page['filename']}:{page['page_num']}"
+
 
+MULTI_PAGE_EXTRACTION_PROMPT = PAGE_EXTRACTION_PROMPT + """
 
-def build_page_prompt(page: Dict[str, Any], schema: Dict[str, Any]) -> str:
-    """Build extraction prompt for a single page."""
+MULTIPLE PAGES: The user prompt contains several pages, each introduced by PAGE [index].
+Extract each page separately and return one entry per page instead of the format above:
+{"pages": [{"index": 0, "entities": [...], "relationships": [...]}, ...]}"""
+
+# Request configs are the same for every page, so build them once
+# NOTE: thinking_config is NOT compatible with response_mime_type="application/json"
+# Using JSON mode for reliable structured output
+PAGE_EXTRACTION_CONFIG = types.GenerateContentConfig(
+    system_instruction=PAGE_EXTRACTION_PROMPT,
+    response_mime_type="application/json",
+)
+MULTI_PAGE_EXTRACTION_CONFIG = types.GenerateContentConfig(
+    system_instruction=MULTI_PAGE_EXTRACTION_PROMPT,
+    response_mime_type="application/json",
+)
+
+
+def _schema_prompt_section(schema: Dict[str, Any]) -> str:
+    """Summarize schema node and relationship types for extraction prompts."""
     node_summary = []
     for node in schema.get("nodes", []):
         props = ", ".join([p["name"] for p in node.get("properties", [])])
@@ -119,18 +162,85 @@ def build_page_prompt(page: Dict[str, Any], schema: Dict[str, Any]) -> str:
     for rel in schema.get("relationships", []):
         rel_summary.append(f"- ({rel['from_label']})-[:{rel['type']}]->({rel['to_label']})")
     
-    return f"""Extract entities and relationships from this policy page.
-
-SCHEMA (use these node types):
+    return f"""SCHEMA (use these node types):
 {chr(10).join(node_summary)}
 
 RELATIONSHIPS:
-{chr(10).join(rel_summary)}
+{chr(10).join(rel_summary)}"""
+
+
+def build_page_prompt(
+    page: Dict[str, Any],
+    schema: Dict[str, Any],
+    critic_feedback: str = None,
+    schema_section: str = None
+) -> str:
+    """
+    Build extraction prompt for a single page.
+    
+    schema_section is the precomputed _schema_prompt_section(schema), so a
+    run over many pages summarizes the schema only once.
+    """
+    if schema_section is None:
+        schema_section = _schema_prompt_section(schema)
+    prompt = f"""Extract entities and relationships from this policy page.
+
+{schema_section}
 
 PAGE CONTENT (from {page['filename']} page {page['page_num']}):
 {page['content']}
 
 Extract ALL entities and relationships from this page. Do not skip any."""
+    
+    if critic_feedback:
+        prompt += f"""
+
+REVIEWER FEEDBACK ON THE PREVIOUS EXTRACTION (address any that apply to this page):
+{critic_feedback}"""
+    
+    return prompt
+
+
+def build_multi_page_prompt(
+    pages: List[Dict[str, Any]],
+    schema: Dict[str, Any],
+    critic_feedback: str = None,
+    schema_section: str = None
+) -> str:
+    """Build one extraction prompt covering several pages, indexed in order."""
+    if schema_section is None:
+        schema_section = _schema_prompt_section(schema)
+    page_sections = "\n\n".join(
+        f"PAGE [{i}] (from {page['filename']} page {page['page_num']}):\n{page['content']}"
+        for i, page in enumerate(pages)
+    )
+    prompt = f"""Extract entities and relationships from each of these policy pages.
+
+{schema_section}
+
+{page_sections}
+
+Extract ALL entities and relationships from every page. Do not skip any."""
+    
+    if critic_feedback:
+        prompt += f"""
+
+REVIEWER FEEDBACK ON THE PREVIOUS EXTRACTION (address any that apply to these pages):
+{critic_feedback}"""
+    
+    return prompt
+
+
+def _tag_page_result(result: Dict[str, Any], page: Dict[str, Any]) -> Dict[str, Any]:
+    """Add page info to each extracted entity (for citation) and relationship."""
+    chunk_id = page_chunk_id(page)
+    for entity in result.get("entities", []):
+        entity["_page"] = page["page_num"]
+        entity["_filename"] = page["filename"]
+        entity["_chunk"] = chunk_id
+    for rel in result.get("relationships", []):
+        rel["_chunk"] = chunk_id
+    return result
 
 
 async def extract_from_page(
@@ -139,7 +249,10 @@ async def extract_from_page(
     client,
     model: str = "gemini-3-pro-preview",
     max_retries: int = 3,
-    timeout_seconds: int = 180  # Increased timeout for large pages
+    timeout_seconds: int = 180,  # Increased timeout for large pages
+    critic_feedback: str = None,
+    use_cache: bool = True,
+    schema_section: str = None
 ) -> Dict[str, Any]:
     """
     Extract entities from a single page using Gemini 3's Thinking Mode.
@@ -148,47 +261,52 @@ async def extract_from_page(
     - ThinkingConfig(thinking_level="high") for exhaustive extraction
     - response_schema for structured output enforcement
     - response_mime_type="application/json" for JSON mode
+    
+    Successful results are cached under the hash of the full prompt (page
+    content, schema, critic feedback), system prompt and model.
     """
-    prompt = build_page_prompt(page, schema)
+    prompt = build_page_prompt(page, schema, critic_feedback, schema_section)
+    cache_key = content_hash(PAGE_EXTRACTION_PROMPT, prompt, model)
+    
+    if use_cache:
+        cached = load_cached_stage("page", cache_key)
+        if isinstance(cached, dict) and isinstance(cached.get("entities"), list):
+            return _tag_page_result(cached, page)
     
     for attempt in range(max_retries):
         try:
             # Wrap API call with timeout
-            # NOTE: thinking_config is NOT compatible with response_mime_type="application/json"
-            # Using JSON mode for reliable structured output
             response = await asyncio.wait_for(
                 client.aio.models.generate_content(
                     model=model,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        system_instruction=PAGE_EXTRACTION_PROMPT,
-                        response_mime_type="application/json",
-                    ),
+                    config=PAGE_EXTRACTION_CONFIG,
                 ),
                 timeout=timeout_seconds
             )
             
             # Extract response text (handle thinking mode response structure)
             response_text = response.text
-            if hasattr(response, 'candidates') and response.candidates:
-                for part in response.candidates[0].content.parts:
-                    if hasattr(part, 'text') and not (hasattr(part, 'thought') and part.thought):
-                        response_text = part.text
-                        break
+            if response.candidates:
+                response_text = next(
+                    (p.text for p in response.candidates[0].content.parts
+                     if p.text and not getattr(p, "thought", False)),
+                    response_text
+                )
             
-            result = json.loads(response_text)
+            result = orjson.loads(response_text)
+            if not isinstance(result, dict) or not isinstance(result.get("entities"), list):
+                raise ValueError("response has no entities list")
+            if not isinstance(result.get("relationships", []), list):
+                raise ValueError("response relationships is not a list")
+            save_cached_stage("page", cache_key, result)
             
-            # Add page info to each entity for citation
-            for entity in result.get("entities", []):
-                entity["_page"] = page["page_num"]
-                entity["_filename"] = page["filename"]
-            
-            return result
+            return _tag_page_result(result, page)
             
         except asyncio.TimeoutError:
             print(f"   [WARN] Page {page['page_num']} attempt {attempt + 1} timed out after {timeout_seconds}s. Retrying...")
             await asyncio.sleep(2)
-        except (json.JSONDecodeError, Exception) as e:
+        except (orjson.JSONDecodeError, Exception) as e:
             if attempt < max_retries - 1:
                 print(f"   [WARN] Page {page['page_num']} attempt {attempt + 1} failed: {str(e)[:50]}. Retrying...")
                 await asyncio.sleep(1 * (attempt + 1))
@@ -199,11 +317,99 @@ async def extract_from_page(
     return {"entities": [], "relationships": []}
 
 
+async def extract_from_pages(
+    pages: List[Dict[str, Any]],
+    schema: Dict[str, Any],
+    client,
+    model: str = "gemini-3-pro-preview",
+    timeout_seconds: int = 180,
+    critic_feedback: str = None,
+    use_cache: bool = True,
+    schema_section: str = None,
+    semaphore: asyncio.Semaphore = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract several pages with a single Gemini call (batch prompting).
+    
+    Pages already in the page cache are served from it. Each page of a
+    successful batch is cached under its single-page key, so the cache works
+    the same whichever way a page was extracted. If the call fails or the
+    response misses a page, the pages fall back to extract_from_page,
+    concurrently.
+    
+    semaphore (optional) bounds Gemini calls: the batch call holds one slot,
+    and each single-page fallback acquires its own after the batch slot is
+    released.
+    
+    Returns:
+        One result per page, in order
+    """
+    if schema_section is None:
+        schema_section = _schema_prompt_section(schema)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(pages)
+    cache_keys = []
+    for i, page in enumerate(pages):
+        key = content_hash(PAGE_EXTRACTION_PROMPT, build_page_prompt(page, schema, critic_feedback, schema_section), model)
+        cache_keys.append(key)
+        cached = load_cached_stage("page", key) if use_cache else None
+        if isinstance(cached, dict) and isinstance(cached.get("entities"), list):
+            results[i] = _tag_page_result(cached, page)
+    
+    limit = semaphore if semaphore is not None else nullcontext()
+    missing = [i for i, result in enumerate(results) if result is None]
+    if len(missing) > 1:
+        batch = [pages[i] for i in missing]
+        try:
+            async with limit:
+                response = await asyncio.wait_for(
+                    client.aio.models.generate_content(
+                        model=model,
+                        contents=build_multi_page_prompt(batch, schema, critic_feedback, schema_section),
+                        config=MULTI_PAGE_EXTRACTION_CONFIG,
+                    ),
+                    timeout=timeout_seconds * len(batch)
+                )
+            by_index = {
+                entry.get("index"): entry
+                for entry in orjson.loads(response.text).get("pages", [])
+                if isinstance(entry, dict)
+                and isinstance(entry.get("entities"), list)
+                and isinstance(entry.get("relationships", []), list)
+            }
+            if all(j in by_index for j in range(len(batch))):
+                for j, i in enumerate(missing):
+                    result = {
+                        "entities": by_index[j]["entities"],
+                        "relationships": by_index[j].get("relationships", []),
+                    }
+                    save_cached_stage("page", cache_keys[i], result)
+                    results[i] = _tag_page_result(result, pages[i])
+            else:
+                print(f"   [WARN] Pages {[p['page_num'] for p in batch]}: incomplete batch response, extracting singly")
+        except Exception as e:
+            print(f"   [WARN] Pages {[p['page_num'] for p in batch]}: batch call failed ({str(e)[:50]}), extracting singly")
+    
+    # Single-page fallback (and the lone uncached page of a batch)
+    async def extract_single(i: int) -> None:
+        async with limit:
+            results[i] = await extract_from_page(
+                pages[i], schema, client, model, critic_feedback=critic_feedback, use_cache=use_cache,
+                schema_section=schema_section
+            )
+    
+    await asyncio.gather(*(extract_single(i) for i, result in enumerate(results) if result is None))
+    
+    return results
+
+
 async def extract_all_pages(
     policy_content: str,
     schema: Dict[str, Any],
     model: str = "gemini-3-pro-preview",
-    log_callback: callable = None
+    log_callback: callable = None,
+    critic_feedback: str = None,
+    only_chunks: List[str] = None,
+    use_cache: bool = True
 ) -> Tuple[List[Dict], List[Dict]]:
     """
     Phase 1: Extract triplets from all pages.
@@ -214,6 +420,9 @@ async def extract_all_pages(
         schema: Schema from Ontology Agent  
         model: Gemini model to use
         log_callback: Optional callback for progress logging
+        critic_feedback: Issues from a rejected previous extraction
+        only_chunks: Page chunk ids to extract (see page_chunk_id); all pages if None
+        use_cache: Reuse cached results for pages whose prompt is unchanged
     """
     log = log_callback or (lambda msg: print(msg))
     client = get_gemini_client()
@@ -228,34 +437,53 @@ async def extract_all_pages(
             "content": policy_content
         }]
     
-    log(f"[EXTRACT] Processing {len(pages)} pages in batches of 2...")
+    if only_chunks is not None:
+        pages = [page for page in pages if page_chunk_id(page) in only_chunks]
+    
+    groups = [pages[i:i + PAGES_PER_CALL] for i in range(0, len(pages), PAGES_PER_CALL)]
+    if PAGES_PER_CALL > 1:
+        log(f"[EXTRACT] Processing {len(pages)} pages in {len(groups)} calls, up to {EXTRACT_CONCURRENCY} at a time...")
+    else:
+        log(f"[EXTRACT] Processing {len(pages)} pages, up to {EXTRACT_CONCURRENCY} at a time...")
+    
+    # Pages run concurrently under a semaphore instead of in fixed batches of
+    # 2, so one slow page no longer holds up the next batch. 429s are
+    # handled by the per-page retry loop.
+    semaphore = asyncio.Semaphore(EXTRACT_CONCURRENCY)
+    completed = 0
+    schema_section = _schema_prompt_section(schema)  # Same for every page
+    
+    async def extract_group(group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        nonlocal completed
+        if len(group) == 1:
+            async with semaphore:
+                results = [await extract_from_page(
+                    group[0], schema, client, model, critic_feedback=critic_feedback, use_cache=use_cache,
+                    schema_section=schema_section
+                )]
+        else:
+            # Acquires the semaphore per call, so failed batches fall back
+            # to concurrent single-page calls
+            results = await extract_from_pages(
+                group, schema, client, model, critic_feedback=critic_feedback, use_cache=use_cache,
+                schema_section=schema_section, semaphore=semaphore
+            )
+        completed += len(group)
+        page_nums = ", ".join(str(p["page_num"]) for p in group)
+        log(f"[EXTRACT] Page {page_nums} done ({completed}/{len(pages)})")
+        return results
+    
+    group_results = await asyncio.gather(*(extract_group(group) for group in groups), return_exceptions=True)
     
     all_entities = []
     all_relationships = []
-    
-    # Process pages in parallel batches of 2 for speed
-    batch_size = 2
-    for i in range(0, len(pages), batch_size):
-        batch = pages[i:i + batch_size]
-        batch_nums = [p['page_num'] for p in batch]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(pages) + batch_size - 1) // batch_size
-        log(f"[EXTRACT] Batch {batch_num}/{total_batches}: Pages {batch_nums}...")
-        
-        # Run batch in parallel
-        tasks = [extract_from_page(page, schema, client, model) for page in batch]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+    for results in group_results:
+        if isinstance(results, Exception):
+            log(f"[EXTRACT] ⚠ Page failed: {str(results)[:50]}")
+            continue
         for result in results:
-            if isinstance(result, Exception):
-                log(f"[EXTRACT] ⚠ Page failed: {str(result)[:50]}")
-                continue
             all_entities.extend(result.get("entities", []))
             all_relationships.extend(result.get("relationships", []))
-        
-        # Small delay between batches to avoid rate limiting
-        if i + batch_size < len(pages):
-            await asyncio.sleep(0.5)
     
     log(f"[EXTRACT] Raw extraction: {len(all_entities)} entities, {len(all_relationships)} relationships")
     
@@ -266,6 +494,11 @@ async def extract_all_pages(
 # PHASE 2: GRAPH LINKER (Python Validation)
 # =============================================================================
 
+# Numbers inside string property values, e.g. "15 days" -> 15
+INTEGER_PATTERN = re.compile(r'\d+')
+FLOAT_PATTERN = re.compile(r'[\d.]+')
+
+
 class GraphLinker:
     """
     Validates and resolves entity/relationship consistency.
@@ -275,7 +508,13 @@ class GraphLinker:
     def __init__(self, schema: Dict[str, Any]):
         self.schema = schema
         self.entity_registry: Dict[Tuple[str, str], Dict] = {}  # (label, name) -> entity
+        self._names_by_label: Dict[str, List[str]] = {}  # label -> registered names, for fuzzy matching
         self.schema_types = self._build_schema_types()
+        # label -> {property_name: type}, only the types validate_types coerces
+        self._coercible = {
+            label: {name: t for name, t in props.items() if t in ("integer", "float", "boolean")}
+            for label, props in self.schema_types.items()
+        }
         self.warnings: List[str] = []
     
     def _build_schema_types(self) -> Dict[str, Dict[str, str]]:
@@ -288,57 +527,63 @@ class GraphLinker:
                 types_map[label][prop["name"]] = prop.get("type", "string")
         return types_map
     
+    def _register(self, key: Tuple[str, str], entity: Dict) -> None:
+        """Index an entity under its (label, name) key; the first one wins."""
+        if key[0] and key[1] and key not in self.entity_registry:
+            self.entity_registry[key] = entity
+            self._names_by_label.setdefault(key[0], []).append(key[1])
+    
     def build_registry(self, entities: List[Dict]) -> None:
         """Index all entities by (label, name) for lookup."""
         for entity in entities:
             label = entity.get("label", "")
             name = entity.get("properties", {}).get("name", "")
-            if label and name:
-                key = (label.lower(), name.lower())
-                if key not in self.entity_registry:
-                    self.entity_registry[key] = entity
+            self._register((label.lower(), name.lower()), entity)
     
     def _fuzzy_match(self, target_label: str, target_name: str, threshold: float = 0.8) -> Optional[str]:
         """Find the best matching entity name using fuzzy matching."""
-        best_match = None
-        best_score = 0.0
+        label = target_label.lower()
+        choices = self._names_by_label.get(label)
+        if not choices:
+            return None
         
-        for (label, name), entity in self.entity_registry.items():
-            if label != target_label.lower():
-                continue
-            
-            score = SequenceMatcher(None, name, target_name.lower()).ratio()
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = entity.get("properties", {}).get("name", name)
+        match = process.extractOne(
+            target_name.lower(), choices, scorer=fuzz.ratio, score_cutoff=threshold * 100
+        )
+        if match is None:
+            return None
         
-        return best_match
+        name = match[0]
+        return self.entity_registry[(label, name)].get("properties", {}).get("name", name)
     
     def validate_types(self, entities: List[Dict]) -> List[Dict]:
         """Coerce property types to match schema definitions."""
         for entity in entities:
-            label = entity.get("label", "")
+            coercible = self._coercible.get(entity.get("label", ""))
+            if not coercible:
+                continue
             props = entity.get("properties", {})
-            schema_props = self.schema_types.get(label, {})
             
-            for prop_name, prop_value in list(props.items()):
-                expected_type = schema_props.get(prop_name)
+            for prop_name, expected_type in coercible.items():
+                prop_value = props.get(prop_name)
+                if not isinstance(prop_value, str):
+                    continue
                 
-                if expected_type == "integer" and isinstance(prop_value, str):
+                if expected_type == "integer":
                     # Try to extract integer from string like "15 days" -> 15
-                    match = re.search(r'\d+', prop_value)
+                    match = INTEGER_PATTERN.search(prop_value)
                     if match:
                         props[prop_name] = int(match.group())
                 
-                elif expected_type == "float" and isinstance(prop_value, str):
-                    match = re.search(r'[\d.]+', prop_value)
+                elif expected_type == "float":
+                    match = FLOAT_PATTERN.search(prop_value)
                     if match:
                         try:
                             props[prop_name] = float(match.group())
                         except ValueError:
                             pass
                 
-                elif expected_type == "boolean" and isinstance(prop_value, str):
+                else:  # boolean
                     props[prop_name] = prop_value.lower() in ("true", "yes", "1")
         
         return entities
@@ -380,7 +625,7 @@ class GraphLinker:
         return resolved
     
     def deduplicate_entities(self, entities: List[Dict]) -> List[Dict]:
-        """Remove duplicate entities by (label, name)."""
+        """Remove duplicate entities by (label, name), registering the kept ones."""
         seen = set()
         unique = []
         
@@ -392,6 +637,7 @@ class GraphLinker:
             if key not in seen:
                 seen.add(key)
                 unique.append(entity)
+                self._register(key, entity)
         
         return unique
     
@@ -399,17 +645,14 @@ class GraphLinker:
         """Execute full linking pipeline."""
         print(f"   [LINKER] Input: {len(entities)} entities, {len(relationships)} relationships")
         
-        # Step 1: Deduplicate
+        # Step 1: Deduplicate (also builds the registry - same keys, first wins)
         entities = self.deduplicate_entities(entities)
         print(f"   [LINKER] After dedup: {len(entities)} entities")
         
-        # Step 2: Build registry
-        self.build_registry(entities)
-        
-        # Step 3: Validate types
+        # Step 2: Validate types
         entities = self.validate_types(entities)
         
-        # Step 4: Resolve relationships
+        # Step 3: Resolve relationships
         relationships = self.resolve_relationships(relationships)
         print(f"   [LINKER] After resolution: {len(relationships)} valid relationships")
         
@@ -426,54 +669,72 @@ class GraphLinker:
 # PHASE 3: CYPHER GENERATOR (Python)
 # =============================================================================
 
-def generate_cypher_statements(
+# Cypher literal formatters by exact property type (bool before int matters,
+# so dispatch on type() rather than isinstance); other types are dropped
+CYPHER_LITERAL_FORMATS = {
+    str: lambda value: '"' + value.replace('"', '\\"') + '"',
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+}
+
+def generate_cypher_payload(
     entities: List[Dict],
     relationships: List[Dict],
     schema: Dict[str, Any]
-) -> List[str]:
-    """Generate Cypher MERGE statements from validated entities and relationships."""
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Generate Cypher MERGE statements and their parameter payloads.
+    
+    The statements are kept for the Critic and the artifact; the payloads
+    carry the same values natively so the Builder can bind them as query
+    parameters instead of re-parsing escaped literals.
+    
+    Returns:
+        (statements, params) - params[i] is {"kind": "node", "label",
+        "properties", "chunk"} or {"kind": "relationship", "from_label",
+        "from_name", "type", "to_label", "to_name", "chunk"} for
+        statements[i], where chunk is the page (see page_chunk_id) the entity
+        or relationship was extracted from
+    """
     statements = []
+    params = []
     
     # Case-insensitive label lookup
-    valid_labels = {node["label"].lower(): node["label"] for node in schema.get("nodes", [])}
+    valid_labels = {node["label"].casefold(): node["label"] for node in schema.get("nodes", [])}
     
     # Generate node statements
     for entity in entities:
         raw_label = entity.get("label", "")
-        label = valid_labels.get(raw_label.lower(), raw_label)
+        label = valid_labels.get(raw_label.casefold(), raw_label)
         props = entity.get("properties", {})
         citation = entity.get("source_citation", "")
         
         if not props.get("name"):
             continue  # Skip entities without names (GraphLinker should have caught this)
         
-        prop_parts = []
-        for key, value in props.items():
-            if key == "source_citation" and citation:
-                continue
-            
-            if isinstance(value, str):
-                safe_value = value.replace('"', '\\"')
-                prop_parts.append(f'{key}: "{safe_value}"')
-            elif isinstance(value, (int, float)):
-                prop_parts.append(f'{key}: {value}')
-            elif isinstance(value, bool):
-                prop_parts.append(f'{key}: {"true" if value else "false"}')
-        
+        prop_values = {
+            key: value for key, value in props.items()
+            if type(value) in CYPHER_LITERAL_FORMATS and not (key == "source_citation" and citation)
+        }
         if citation:
-            safe_citation = citation.replace('"', '\\"')
-            prop_parts.append(f'source_citation: "{safe_citation}"')
+            prop_values["source_citation"] = citation
         
-        prop_string = ", ".join(prop_parts)
+        prop_string = ", ".join(
+            f"{key}: {CYPHER_LITERAL_FORMATS[type(value)](value)}" for key, value in prop_values.items()
+        )
         stmt = f"MERGE (n:{label} {{{prop_string}}})"
         statements.append(stmt)
+        params.append({"kind": "node", "label": label, "properties": prop_values, "chunk": entity.get("_chunk")})
     
     # Generate relationship statements
     for rel in relationships:
-        from_label = valid_labels.get(rel.get("from_label", "").lower(), rel.get("from_label", ""))
+        from_label = rel.get("from_label", "")
+        from_label = valid_labels.get(from_label.casefold(), from_label)
         from_name = rel.get("from_name", "")
         rel_type = rel.get("type", "")
-        to_label = valid_labels.get(rel.get("to_label", "").lower(), rel.get("to_label", ""))
+        to_label = rel.get("to_label", "")
+        to_label = valid_labels.get(to_label.casefold(), to_label)
         to_name = rel.get("to_name", "")
         
         if not all([from_label, from_name, rel_type, to_label, to_name]):
@@ -484,8 +745,26 @@ def generate_cypher_statements(
         
         stmt = f'MATCH (a:{from_label} {{name: "{safe_from}"}}), (b:{to_label} {{name: "{safe_to}"}}) MERGE (a)-[:{rel_type}]->(b)'
         statements.append(stmt)
+        params.append({
+            "kind": "relationship",
+            "from_label": from_label,
+            "from_name": from_name,
+            "type": rel_type,
+            "to_label": to_label,
+            "to_name": to_name,
+            "chunk": rel.get("_chunk"),
+        })
     
-    return statements
+    return statements, params
+
+
+def generate_cypher_statements(
+    entities: List[Dict],
+    relationships: List[Dict],
+    schema: Dict[str, Any]
+) -> List[str]:
+    """Generate Cypher MERGE statements from validated entities and relationships."""
+    return generate_cypher_payload(entities, relationships, schema)[0]
 
 
 # =============================================================================
@@ -496,7 +775,11 @@ async def extract_policy_rules(
     policy_content: str = None,
     schema: Dict[str, Any] = None,
     model: str = None,
-    log_callback: callable = None
+    log_callback: callable = None,
+    critic_feedback: str = None,
+    only_chunks: List[str] = None,
+    previous_extraction: Dict[str, Any] = None,
+    use_cache: bool = True
 ) -> Dict[str, Any]:
     """
     Full extraction pipeline: Extract -> Link -> Generate.
@@ -506,6 +789,11 @@ async def extract_policy_rules(
         schema: Schema from Ontology Agent
         model: Gemini model to use
         log_callback: Optional callback for progress logging
+        critic_feedback: Issues from a rejected previous extraction
+        only_chunks: Re-extract only these pages, keeping the raw triplets of
+            the others from previous_extraction
+        previous_extraction: Extraction that only_chunks revises
+        use_cache: Reuse cached per-page extraction results
     """
     log = log_callback or (lambda msg: print(msg))
     
@@ -521,9 +809,24 @@ async def extract_policy_rules(
     if model is None:
         model = os.getenv("EXTRACTION_MODEL", "gemini-3-pro-preview")
     
+    # Partial re-extraction needs the previous raw triplets to merge into
+    if only_chunks and not (previous_extraction or {}).get("_raw_entities"):
+        only_chunks = None
+    
     # Phase 1: Extract raw triplets
     log("[EXTRACTION] Phase 1: Extracting entities from pages...")
-    raw_entities, raw_relationships = await extract_all_pages(policy_content, schema, model, log_callback=log)
+    raw_entities, raw_relationships = await extract_all_pages(
+        policy_content, schema, model, log_callback=log, critic_feedback=critic_feedback,
+        only_chunks=only_chunks, use_cache=use_cache
+    )
+    if only_chunks:
+        # Replace the flagged pages' triplets, keep everything else
+        raw_entities = [
+            e for e in previous_extraction["_raw_entities"] if e.get("_chunk") not in only_chunks
+        ] + raw_entities
+        raw_relationships = [
+            r for r in previous_extraction.get("_raw_relationships", []) if r.get("_chunk") not in only_chunks
+        ] + raw_relationships
     log(f"[EXTRACTION] Phase 1 done: {len(raw_entities)} raw entities found")
     
     # Phase 2: Link and validate
@@ -538,13 +841,14 @@ async def extract_policy_rules(
     
     # Phase 3: Generate Cypher
     log("[EXTRACTION] Phase 3: Generating Cypher statements...")
-    cypher_statements = generate_cypher_statements(clean_entities, clean_relationships, schema)
+    cypher_statements, cypher_params = generate_cypher_payload(clean_entities, clean_relationships, schema)
     log(f"[EXTRACTION] Phase 3 done: {len(cypher_statements)} Cypher statements")
     
     extraction = {
         "cypher_statements": cypher_statements,
+        "cypher_params": cypher_params,
         "extraction_summary": {
-            "total_pages": len(split_by_page_markers(policy_content)) or 1,
+            "total_pages": sum(1 for _ in iter_page_markers(policy_content)) or 1,
             "raw_entities": len(raw_entities),
             "raw_relationships": len(raw_relationships),
             "clean_entities": len(clean_entities),
@@ -554,6 +858,9 @@ async def extract_policy_rules(
         },
         "entities": clean_entities,
         "relationships": clean_relationships,
+        # Per-page triplets, so a critic revision can re-extract single pages
+        "_raw_entities": raw_entities,
+        "_raw_relationships": raw_relationships,
     }
     
     artifact_path = save_artifact("extracted_cypher", extraction)
@@ -562,20 +869,38 @@ async def extract_policy_rules(
     return extraction
 
 
-async def run_extraction_agent(schema: Dict[str, Any] = None, log_callback: callable = None) -> Dict[str, Any]:
+async def run_extraction_agent(
+    schema: Dict[str, Any] = None,
+    log_callback: callable = None,
+    critic_feedback: str = None,
+    only_chunks: List[str] = None,
+    previous_extraction: Dict[str, Any] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
     """
     Main entry point for the Extraction agent.
     
     Args:
         schema: The schema from Ontology Agent
         log_callback: Optional callback for progress logging
+        critic_feedback: Issues from a rejected previous extraction, added to page prompts
+        only_chunks: Page chunk ids to re-extract (all pages if None)
+        previous_extraction: Extraction to merge a partial re-extraction into
+        use_cache: Reuse cached per-page extraction results
     """
     log = log_callback or (lambda msg: print(msg))
     
     log("[EXTRACTION] Starting 3-phase extraction pipeline...")
     
     try:
-        extraction = await extract_policy_rules(schema=schema, log_callback=log)
+        extraction = await extract_policy_rules(
+            schema=schema,
+            log_callback=log,
+            critic_feedback=critic_feedback,
+            only_chunks=only_chunks,
+            previous_extraction=previous_extraction,
+            use_cache=use_cache
+        )
         
         summary = extraction.get("extraction_summary", {})
         
@@ -598,4 +923,4 @@ async def run_extraction_agent(schema: Dict[str, Any] = None, log_callback: call
 
 if __name__ == "__main__":
     result = asyncio.run(run_extraction_agent())
-    print(json.dumps(result, indent=2, default=str))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode())
@@ -8,6 +8,7 @@ to fetch all policy-related nodes connected to a ProductCategory.
 
 import sys
 import os
+import asyncio
 from typing import Any, Dict, List
 
 # Add project root to path
@@ -20,8 +21,11 @@ from neo4j_graph_engine.db import execute_query as query_graph
 # STRUCTURED TRAVERSAL QUERY
 # =============================================================================
 
+# Categories are passed as a list and UNWOUND so that any number of
+# categories resolve in a single Neo4j round-trip.
 TRAVERSAL_QUERY = """
-MATCH (pc:ProductCategory {name: $category})
+UNWIND $categories AS cname
+MATCH (pc:ProductCategory {name: cname})
 
 // Hop 1: Direct connections from ProductCategory
 OPTIONAL MATCH (pc)-[r1]->(hop1)
@@ -33,6 +37,7 @@ OPTIONAL MATCH (hop1)-[r2]->(hop2)
 OPTIONAL MATCH (hop2)-[r3]->(hop3)
 
 RETURN 
+    cname AS category_name,
     properties(pc) AS category,
     
     collect(DISTINCT CASE WHEN hop1 IS NOT NULL THEN {
@@ -59,46 +64,97 @@ RETURN
 """
 
 
-async def traverse_from_category(category: str) -> Dict[str, Any]:
+def _empty_traversal(category: str) -> Dict[str, Any]:
+    """Traversal result for a category with no matching graph nodes."""
+    return {
+        "category": {"name": category},
+        "hop1_nodes": [],
+        "hop2_nodes": [],
+        "hop3_nodes": []
+    }
+
+
+async def traverse_from_categories(categories: List[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Traverse the knowledge graph starting from a ProductCategory.
+    Traverse the knowledge graph from several ProductCategories at once.
     
-    Returns all connected nodes within 3 hops, preserving relationship context.
+    All categories are resolved with a single UNWIND query instead of one
+    round-trip per category.
     
     Args:
-        category: The ProductCategory name to start traversal from
+        categories: ProductCategory names to start traversal from
         
     Returns:
-        Dict with category info, hop1_nodes, hop2_nodes, hop3_nodes
+        Dict mapping category name -> traversal result (same shape as
+        traverse_from_category)
     """
-    print(f"   [TRAVERSAL] Starting from category: {category}")
+    # Preserve order while dropping duplicates
+    unique_categories = list(dict.fromkeys(c for c in categories if c))
+    if not unique_categories:
+        return {}
     
-    results = await query_graph(TRAVERSAL_QUERY, {"category": category})
+    print(f"   [TRAVERSAL] Starting from categories: {unique_categories}")
     
-    if not results:
-        print(f"   [TRAVERSAL] No results for category: {category}")
-        return {
-            "category": {"name": category},
-            "hop1_nodes": [],
-            "hop2_nodes": [],
-            "hop3_nodes": []
+    results = await query_graph(TRAVERSAL_QUERY, {"categories": unique_categories})
+    
+    traversals = {}
+    for result in results:
+        name = result.get("category_name")
+        
+        # Filter out None values from collections
+        hop1 = [n for n in result.get("hop1_nodes", []) if n is not None]
+        hop2 = [n for n in result.get("hop2_nodes", []) if n is not None]
+        hop3 = [n for n in result.get("hop3_nodes", []) if n is not None]
+        
+        print(f"   [TRAVERSAL] {name}: {len(hop1)} hop1, {len(hop2)} hop2, {len(hop3)} hop3 nodes")
+        
+        traversals[name] = {
+            "category": result.get("category") or {"name": name},
+            "hop1_nodes": hop1,
+            "hop2_nodes": hop2,
+            "hop3_nodes": hop3
         }
     
-    result = results[0]
+    for category in unique_categories:
+        if category not in traversals:
+            print(f"   [TRAVERSAL] No results for category: {category}")
+            traversals[category] = _empty_traversal(category)
     
-    # Filter out None values from collections
-    hop1 = [n for n in result.get("hop1_nodes", []) if n is not None]
-    hop2 = [n for n in result.get("hop2_nodes", []) if n is not None]
-    hop3 = [n for n in result.get("hop3_nodes", []) if n is not None]
+    return traversals
+
+
+async def traverse_from_category(category: str) -> Dict[str, Any]:
+    """
+    Traverse the knowledge graph starting from a ProductCategory.
     
-    print(f"   [TRAVERSAL] Found {len(hop1)} hop1, {len(hop2)} hop2, {len(hop3)} hop3 nodes")
+    Returns all connected nodes within 3 hops, preserving relationship context.
     
-    return {
-        "category": result.get("category", {"name": category}),
-        "hop1_nodes": hop1,
-        "hop2_nodes": hop2,
-        "hop3_nodes": hop3
-    }
+    Args:
+        category: The ProductCategory name to start traversal from
+        
+    Returns:
+        Dict with category info, hop1_nodes, hop2_nodes, hop3_nodes
+    """
+    traversals = await traverse_from_categories([category])
+    return traversals.get(category) or _empty_traversal(category)
+
+
+def _coerce_number(value: Any, cast: type) -> Any:
+    """
+    Cast a graph property to int/float once; leave non-numeric values as-is.
+    
+    With cast=int, only integral values become int - a fractional value
+    (e.g. 30.5 days) stays a float rather than being truncated.
+    """
+    if value is None or isinstance(value, bool):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    if cast is int and number.is_integer():
+        return int(number)
+    return number
 
 
 def build_policy_profile(traversal_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -106,6 +162,8 @@ def build_policy_profile(traversal_result: Dict[str, Any]) -> Dict[str, Any]:
     Convert raw traversal result into a structured policy profile.
     
     Groups nodes by type and preserves relationship context for decision-making.
+    Numeric rule properties (window days, fee values) are cast once here so
+    downstream consumers get typed values.
     
     Args:
         traversal_result: Output from traverse_from_category()
@@ -124,6 +182,11 @@ def build_policy_profile(traversal_result: Dict[str, Any]) -> Dict[str, Any]:
         "citations": set()      # All source citations for source text lookup
     }
     
+    # Reverse indexes (name -> entries) so hop-2 nodes attach in O(1)
+    windows_by_name: Dict[str, List[Dict[str, Any]]] = {}
+    fees_by_name: Dict[str, List[Dict[str, Any]]] = {}
+    restrictions_by_name: Dict[str, List[Dict[str, Any]]] = {}
+    
     # Process Hop 1 - Direct connections from ProductCategory
     for node in traversal_result["hop1_nodes"]:
         rel = node.get("rel", "")
@@ -135,29 +198,35 @@ def build_policy_profile(traversal_result: Dict[str, Any]) -> Dict[str, Any]:
             profile["citations"].add(data["source_citation"])
         
         if rel == "HAS_RETURN_WINDOW" and label == "ReturnWindow":
-            profile["windows"].append({
+            window = {
                 "name": data.get("name"),
-                "days": data.get("days"),
+                "days": _coerce_number(data.get("days"), int),
                 "citation": data.get("source_citation"),
                 "tiers": []  # Will be filled from hop2
-            })
+            }
+            profile["windows"].append(window)
+            windows_by_name.setdefault(window["name"], []).append(window)
         
         elif rel == "SUBJECT_TO_FEE" and label == "Fee":
-            profile["fees"].append({
+            fee = {
                 "name": data.get("name"),
-                "value": data.get("value"),
+                "value": _coerce_number(data.get("value"), float),
                 "amount_type": data.get("amount_type"),
                 "citation": data.get("source_citation"),
                 "waivers": [],      # Conditions that waive this fee
                 "exemptions": []    # Regions where fee is exempt
-            })
+            }
+            profile["fees"].append(fee)
+            fees_by_name.setdefault(fee["name"], []).append(fee)
         
         elif rel == "HAS_RESTRICTION" and label == "Restriction":
-            profile["restrictions"].append({
+            restriction = {
                 "name": data.get("name"),
                 "citation": data.get("source_citation"),
                 "triggers": []  # Conditions that trigger this restriction
-            })
+            }
+            profile["restrictions"].append(restriction)
+            restrictions_by_name.setdefault(restriction["name"], []).append(restriction)
         
         elif rel == "REQUIRES_CONDITION" and label == "Condition":
             profile["required_conditions"].append({
@@ -185,35 +254,27 @@ def build_policy_profile(traversal_result: Dict[str, Any]) -> Dict[str, Any]:
         
         # ReturnWindow -> MembershipTier (which tier gets this window)
         if via_rel == "HAS_RETURN_WINDOW" and to_rel == "APPLIES_TO_MEMBERSHIP":
-            window_name = via_data.get("name")
             tier_name = to_data.get("name")
-            for w in profile["windows"]:
-                if w["name"] == window_name:
-                    w["tiers"].append(tier_name)
+            for w in windows_by_name.get(via_data.get("name"), ()):
+                w["tiers"].append(tier_name)
         
         # Fee -> Condition (waiver condition)
         elif via_rel == "SUBJECT_TO_FEE" and to_rel == "WAIVED_IF":
-            fee_name = via_data.get("name")
             condition_name = to_data.get("name")
-            for f in profile["fees"]:
-                if f["name"] == fee_name:
-                    f["waivers"].append(condition_name)
+            for f in fees_by_name.get(via_data.get("name"), ()):
+                f["waivers"].append(condition_name)
         
         # Fee -> Region (exemption region)
         elif via_rel == "SUBJECT_TO_FEE" and to_rel == "EXEMPT_IN_REGION":
-            fee_name = via_data.get("name")
             region_name = to_data.get("name")
-            for f in profile["fees"]:
-                if f["name"] == fee_name:
-                    f["exemptions"].append(region_name)
+            for f in fees_by_name.get(via_data.get("name"), ()):
+                f["exemptions"].append(region_name)
         
         # Restriction -> Condition (trigger condition)
         elif via_rel == "HAS_RESTRICTION" and to_rel == "TRIGGERED_BY_CONDITION":
-            restriction_name = via_data.get("name")
             condition_name = to_data.get("name")
-            for r in profile["restrictions"]:
-                if r["name"] == restriction_name:
-                    r["triggers"].append(condition_name)
+            for r in restrictions_by_name.get(via_data.get("name"), ()):
+                r["triggers"].append(condition_name)
     
     # Convert citations set to list
     profile["citations"] = list(profile["citations"])
@@ -225,3 +286,30 @@ async def get_all_categories() -> List[str]:
     """Fetch all ProductCategory names from Neo4j."""
     results = await query_graph("MATCH (p:ProductCategory) RETURN p.name as name ORDER BY p.name")
     return [r["name"] for r in results if r.get("name")]
+
+
+async def warm_up_graph(categories: List[str] = None) -> None:
+    """
+    Warm Neo4j caches so the first adjudication avoids the cold-start penalty.
+    
+    Touches ProductCategory nodes (all of them, or just `categories`) and their
+    outgoing relationships (page cache), and runs TRAVERSAL_QUERY with an empty
+    list so its plan is compiled and cached without doing any traversal work.
+    The two queries are independent and run concurrently.
+    """
+    if categories is None:
+        touch_query = "MATCH (pc:ProductCategory) OPTIONAL MATCH (pc)-[r]->() RETURN count(r) AS rels"
+        params = None
+    else:
+        touch_query = (
+            "MATCH (pc:ProductCategory) WHERE pc.name IN $names "
+            "OPTIONAL MATCH (pc)-[r]->() RETURN count(r) AS rels"
+        )
+        params = {"names": categories}
+    
+    touched, _ = await asyncio.gather(
+        query_graph(touch_query, params),
+        query_graph(TRAVERSAL_QUERY, {"categories": []})
+    )
+    rels = touched[0]["rels"] if touched else 0
+    print(f"   [TRAVERSAL] Warmed graph caches ({rels} category relationships)")
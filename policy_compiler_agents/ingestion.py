@@ -10,10 +10,11 @@ NOTE: This code mirrors the working implementation from policy_engine/mcp_server
 
 import os
 import glob
-import json
 import asyncio
 from datetime import datetime
 from typing import Dict, Any
+
+import orjson
 from llama_parse import LlamaParse
 
 # Apply nest_asyncio only if not running with uvloop (Docker/production)
@@ -137,8 +138,8 @@ async def parse_documents(
             f.write(final_content)
         
         # Write index file
-        with open(index_path, "w", encoding="utf-8") as f:
-            json.dump(page_index, f, indent=2)
+        with open(index_path, "wb") as f:
+            f.write(orjson.dumps(page_index, option=orjson.OPT_INDENT_2))
         
         return {
             "status": "success",
@@ -17,10 +17,11 @@ import json
 import asyncio
 from typing import Any, Dict
 
+import orjson
 from google.genai import types
 from google.genai.types import ThinkingConfig, Schema
 
-from .tools import get_gemini_client, read_policy_markdown, save_artifact
+from .tools import get_gemini_client, read_policy_markdown, save_artifact, get_retry_delay
 
 # Retry settings for transient API errors (503, 429)
 MAX_RETRIES = 3
@@ -202,7 +203,7 @@ Remember: Every node type MUST include 'name' and 'source_citation' properties."
             error_str = str(e).lower()
             is_retryable = "503" in str(e) or "429" in str(e) or "overloaded" in error_str or "unavailable" in error_str
             if is_retryable and attempt < MAX_RETRIES - 1:
-                delay = BASE_DELAY * (2 ** attempt)
+                delay = get_retry_delay(e, attempt, BASE_DELAY)
                 print(f"[ONTOLOGY] API error (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)[:80]}")
                 print(f"[ONTOLOGY] Retrying in {delay:.1f}s...")
                 await asyncio.sleep(delay)
@@ -229,8 +230,8 @@ Remember: Every node type MUST include 'name' and 'source_citation' properties."
     
     # Parse JSON response with robust error handling
     try:
-        schema = json.loads(response_text)
-    except json.JSONDecodeError as e:
+        schema = orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
         # Fail fast if response_mime_type didn't work
         raise ValueError(f"Failed to parse JSON response (JSONDecodeError: {e}). Raw: {response_text[:500]}")
     
@@ -7,15 +7,19 @@ the original policy text from combined_policy.md for LLM context.
 """
 
 import os
-import json
 import re
 from typing import Dict, List, Optional
 
+import orjson
+
 # Path configuration
 POLICY_DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "policy_docs")
 COMBINED_POLICY_PATH = os.path.join(POLICY_DOCS_DIR, "combined_policy.md")
 POLICY_INDEX_PATH = os.path.join(POLICY_DOCS_DIR, "combined_policy_index.json")
 
+# Citation format: filename:pageN:lineN
+CITATION_PATTERN = re.compile(r"^(.+\.pdf):page(\d+):line(\d+)$", re.IGNORECASE)
+
 
 def parse_citation(citation: str) -> Optional[Dict[str, any]]:
     """
@@ -32,9 +36,7 @@ def parse_citation(citation: str) -> Optional[Dict[str, any]]:
     if not citation:
         return None
     
-    # Match pattern: filename:pageN:lineN
-    pattern = r"^(.+\.pdf):page(\d+):line(\d+)$"
-    match = re.match(pattern, citation, re.IGNORECASE)
+    match = CITATION_PATTERN.match(citation)
     
     if match:
         return {
@@ -49,8 +51,8 @@ def parse_citation(citation: str) -> Optional[Dict[str, any]]:
 def load_policy_index() -> Dict:
     """Load the policy index JSON file."""
     try:
-        with open(POLICY_INDEX_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(POLICY_INDEX_PATH, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         print(f"   [SOURCE] Error loading policy index: {e}")
         return {"pages": []}
@@ -86,8 +88,11 @@ def get_source_text(citations: List[str], context_lines: int = 5) -> Dict[str, s
         print("   [SOURCE] No policy markdown loaded")
         return {}
     
-    # Load index for page-to-line mapping
+    # Load index for page-to-line mapping, keyed for O(1) lookup per citation
     index = load_policy_index()
+    pages_by_key = {}
+    for page in index.get("pages", []):
+        pages_by_key.setdefault((page["filename"], page["page"]), page)
     
     source_texts = {}
     
@@ -102,11 +107,7 @@ def get_source_text(citations: List[str], context_lines: int = 5) -> Dict[str, s
         # to find the corresponding line in our combined markdown
         
         # Option 1: Use page-based lookup from index
-        page_info = None
-        for page in index.get("pages", []):
-            if page["page"] == parsed["page"] and page["filename"] == parsed["filename"]:
-                page_info = page
-                break
+        page_info = pages_by_key.get((parsed["filename"], parsed["page"]))
         
         if page_info:
             # Calculate absolute line number in combined markdown
@@ -0,0 +1,146 @@
+"""
+Tests for the Builder's statement planning (pure functions, no Neo4j needed).
+
+Run: python -m pytest policy_compiler_agents/test_builder_agent.py
+"""
+
+from policy_compiler_agents.builder_agent import (
+    _partition_lanes,
+    _uses_double_equals,
+    parse_cypher_statement,
+    plan_cypher_batches,
+)
+
+
+# =============================================================================
+# parse_cypher_statement
+# =============================================================================
+
+def test_parse_node_with_escaped_quotes():
+    spec = parse_cypher_statement(
+        'MERGE (n:Policy {name: "The \\"Gold\\" tier", days: 30, fee: 4.5, active: true})'
+    )
+    assert spec == {
+        "kind": "node",
+        "label": "Policy",
+        "properties": {"name": 'The "Gold" tier', "days": 30, "fee": 4.5, "active": True},
+    }
+
+
+def test_parse_relationship_with_escaped_quotes():
+    spec = parse_cypher_statement(
+        'MATCH (a:Policy {name: "Say \\"hi\\""}), (b:Rule {name: "R1"}) MERGE (a)-[:HAS_RULE]->(b)'
+    )
+    assert spec == {
+        "kind": "relationship",
+        "from_label": "Policy",
+        "from_name": 'Say "hi"',
+        "type": "HAS_RULE",
+        "to_label": "Rule",
+        "to_name": "R1",
+    }
+
+
+def test_parse_duplicate_keys_falls_back():
+    assert parse_cypher_statement('MERGE (n:Policy {name: "A", name: "B"})') is None
+
+
+def test_parse_unknown_shape_falls_back():
+    assert parse_cypher_statement('CREATE (n:Policy {name: "A"})') is None
+    assert parse_cypher_statement('MERGE (n:Policy {name: "trailing\\"})') is None
+
+
+# =============================================================================
+# plan_cypher_batches
+# =============================================================================
+
+def test_plan_groups_nodes_by_label_and_keys():
+    nodes, verbatim, rels = plan_cypher_batches([
+        'MERGE (n:Policy {name: "A"})',
+        'MERGE (n:Policy {name: "B"})',
+        'MERGE (n:Policy {name: "C", days: 3})',
+    ])
+    assert verbatim == [] and rels == []
+    assert [group["indexes"] for group in nodes] == [[0, 1], [2]]
+    assert nodes[0]["query"] == "UNWIND $rows AS row MERGE (n:Policy {name: row.name})"
+    assert nodes[0]["rows"] == [{"name": "A"}, {"name": "B"}]
+
+
+def test_plan_skips_duplicate_statements():
+    nodes, _, _ = plan_cypher_batches([
+        'MERGE (n:Policy {name: "A"})',
+        '  MERGE (n:Policy {name: "A"})',
+    ])
+    assert [group["indexes"] for group in nodes] == [[0]]
+
+
+def test_plan_non_identifier_label_runs_verbatim():
+    statements = ['MERGE (n:`Return Policy` {name: "A"})', 'MERGE (n:Policy {name: "B"})']
+    params = [
+        {"kind": "node", "label": "Return Policy", "properties": {"name": "A"}},
+        {"kind": "node", "label": "Policy", "properties": {"name": "B"}},
+    ]
+    nodes, verbatim, _ = plan_cypher_batches(statements, params)
+    assert [group["indexes"] for group in nodes] == [[1]]
+    assert verbatim == [{"query": statements[0], "rows": None, "indexes": [0], "labels": None}]
+
+
+def test_plan_non_identifier_property_key_runs_verbatim():
+    params = [{"kind": "node", "label": "Policy", "properties": {"name": "A", "bad key": 1}}]
+    nodes, verbatim, _ = plan_cypher_batches(["stmt"], params)
+    assert nodes == [] and [unit["indexes"] for unit in verbatim] == [[0]]
+
+
+def test_plan_runs_relationships_after_nodes():
+    nodes, verbatim, rels = plan_cypher_batches([
+        'MATCH (a:Policy {name: "A"}), (b:Rule {name: "R"}) MERGE (a)-[:HAS_RULE]->(b)',
+        'CREATE (n:Note {text: "x"})',
+        'MERGE (n:Rule {name: "R"})',
+        'MERGE (n:Policy {name: "A"})',
+    ])
+    assert [group["indexes"] for group in nodes] == [[2], [3]]
+    assert [unit["indexes"] for unit in verbatim] == [[1]]
+    assert [group["indexes"] for group in rels] == [[0]]
+    assert rels[0]["rows"] == [{"from_name": "A", "to_name": "R"}]
+    assert rels[0]["labels"] == {"Policy", "Rule"}
+
+
+# =============================================================================
+# _partition_lanes
+# =============================================================================
+
+def _unit(name, labels):
+    return {"query": name, "labels": labels}
+
+
+def test_lanes_merge_transitively():
+    units = [
+        _unit("a", {"X"}),
+        _unit("b", {"Y"}),
+        _unit("c", {"Z"}),
+        _unit("d", {"X", "Y"}),
+    ]
+    lanes = _partition_lanes(units)
+    assert [[unit["query"] for unit in lane] for lane in lanes] == [["a", "b", "d"], ["c"]]
+
+
+def test_lanes_keep_unknown_labels_together():
+    units = [_unit("a", None), _unit("b", {"X"}), _unit("c", None)]
+    lanes = _partition_lanes(units)
+    assert [[unit["query"] for unit in lane] for lane in lanes] == [["a", "c"], ["b"]]
+
+
+# =============================================================================
+# _uses_double_equals
+# =============================================================================
+
+def test_double_equals_outside_literals():
+    assert _uses_double_equals('MATCH (n:Policy) WHERE n.days == 30 RETURN n')
+    assert _uses_double_equals('MATCH (n {name: "a"}) WHERE n.x == 1 SET n.y = "b"')
+
+
+def test_double_equals_inside_literals_ignored():
+    assert not _uses_double_equals('CREATE (n:Note {text: "a==b"})')
+    assert not _uses_double_equals("CREATE (n:Note {text: 'say \\'x==y\\''})")
+    assert not _uses_double_equals('CREATE (n:Note {text: "back\\\\", other: "=="})')
+    assert not _uses_double_equals('MATCH (n:`a==b`) RETURN n')
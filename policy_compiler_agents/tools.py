@@ -6,10 +6,14 @@ and interacting with the Neo4j knowledge graph.
 """
 
 import os
-import json
+import re
+import random
+import hashlib
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -18,6 +22,7 @@ load_dotenv()
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 POLICY_DOCS_DIR = os.path.join(PROJECT_ROOT, "policy_docs")
 ARTIFACTS_DIR = os.path.join(PROJECT_ROOT, "artifacts", "knowledge_graph")
+STAGE_CACHE_DIR = os.path.join(ARTIFACTS_DIR, "cache")
 
 # Ensure artifacts directory exists
 os.makedirs(ARTIFACTS_DIR, exist_ok=True)
@@ -63,15 +68,37 @@ def save_artifact(name: str, content: Any, artifact_type: str = "json") -> str:
             "artifact_name": name,
         }
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        if artifact_type == "json":
-            json.dump(content, f, indent=2, ensure_ascii=False)
-        else:
+    if artifact_type == "json":
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
             f.write(str(content))
     
     return filepath
 
 
+@contextmanager
+def open_event_log(name: str):
+    """
+    Open an append-only NDJSON log in the artifacts directory.
+    
+    Yields a function that writes one event per line and flushes it, so
+    the steps logged so far survive a crash mid-run.
+    
+    Args:
+        name: Base name of the log (without extension)
+    """
+    filepath = os.path.join(ARTIFACTS_DIR, f"{name}.ndjson")
+    with open(filepath, "wb") as f:
+        def write_event(event: Dict[str, Any]) -> None:
+            line = {"timestamp": datetime.now().isoformat(), **event}
+            f.write(orjson.dumps(line, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+            f.flush()
+        
+        yield write_event
+
+
 def load_artifact(name: str, artifact_type: str = "json") -> Any:
     """
     Load a previously saved artifact.
@@ -89,12 +116,70 @@ def load_artifact(name: str, artifact_type: str = "json") -> Any:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Artifact not found: {filepath}")
     
+    if artifact_type == "json":
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
     with open(filepath, "r", encoding="utf-8") as f:
-        if artifact_type == "json":
-            return json.load(f)
         return f.read()
 
 
+def content_hash(*parts: Any) -> str:
+    """
+    SHA-256 cache key over strings and JSON-serializable values.
+    
+    Top-level dict keys starting with "_" (artifact metadata, thinking
+    traces) are ignored so they don't invalidate the key.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, dict):
+            part = {k: v for k, v in part.items() if not k.startswith("_")}
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        else:
+            part = orjson.dumps(part, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_cached_stage(stage: str, key: str) -> Optional[Any]:
+    """
+    Load a cached pipeline stage result.
+    
+    Args:
+        stage: Stage name (e.g. "ontology")
+        key: Content hash of the stage inputs
+        
+    Returns:
+        The cached result, or None on a miss
+    """
+    filepath = os.path.join(STAGE_CACHE_DIR, f"{stage}-{key}.json")
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def save_cached_stage(stage: str, key: str, content: Any) -> str:
+    """
+    Cache a pipeline stage result under the content hash of its inputs.
+    
+    Returns:
+        Path to the cache file
+    """
+    os.makedirs(STAGE_CACHE_DIR, exist_ok=True)
+    filepath = os.path.join(STAGE_CACHE_DIR, f"{stage}-{key}.json")
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"  # Per-process, so concurrent pipelines never share it
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS))
+    os.replace(tmp_path, filepath)
+    return filepath
+
+
 def extract_section_citations(markdown_content: str) -> Dict[str, str]:
     """
     Extract section headers and their line numbers from markdown.
@@ -153,6 +238,44 @@ def get_gemini_client():
     return client
 
 
+# Matches retry hints in Gemini error payloads, e.g. "'retryDelay': '23s'"
+RETRY_DELAY_PATTERN = re.compile(r"retry[-_ ]?(?:delay|after)\W*(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+
+def parse_retry_after(error: Exception) -> Optional[float]:
+    """
+    Return the server-requested retry delay (seconds) carried by an API error.
+    
+    Checks a Retry-After response header first, then a retryDelay /
+    Retry-After hint in the error text.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+    
+    match = RETRY_DELAY_PATTERN.search(str(error))
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def get_retry_delay(error: Exception, attempt: int, base_delay: float, max_delay: float = 60.0) -> float:
+    """
+    Delay before retrying a failed Gemini call.
+    
+    Prefers the server-requested delay; otherwise capped exponential backoff
+    plus up to base_delay of random jitter so concurrent callers don't retry
+    in lockstep.
+    """
+    retry_after = parse_retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return min(max_delay, base_delay * (2 ** attempt)) + random.random() * base_delay
+
+
 # Pre-load policy content for agents
 def get_policy_content() -> str:
     """Get the cached policy content."""
@@ -177,8 +300,8 @@ class CitationManager:
         """Load the page index file."""
         index_path = os.path.join(POLICY_DOCS_DIR, "combined_policy_index.json")
         if os.path.exists(index_path):
-            with open(index_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(index_path, "rb") as f:
+                return orjson.loads(f.read())
         return {"pages": []}
     
     def get_page_for_line(self, line_num: int) -> Optional[Dict[str, Any]]: